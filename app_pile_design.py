@@ -3,7 +3,7 @@ app_pile_design.py - Entry Point for Streamlit Deployment
 =========================================================
 
 This file serves as the main entry point for Streamlit Cloud deployment.
-It executes the current version (v2.1) of the pile design application.
+It runs the current version (v2.1) of the pile design application.
 
 For local development, you can run either:
 - streamlit run app_pile_design.py (uses this file)
@@ -12,18 +12,19 @@ For local development, you can run either:
 Copyright (c) 2025 Dr. Chitti S S U Srikanth. All rights reserved.
 """
 
-# Execute the current version (v2.1) directly
-# This ensures all Streamlit code runs properly
+# Import the current version (v2.1) once and call its main() on each rerun.
+# Python caches the module in sys.modules, so reruns skip re-reading and
+# re-compiling the v2.1 source.
 import os
 import sys
 
-# Get the directory of this file
+# Make sure the v2.1 module is importable from this file's directory
 current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
 
-# Path to the v2.1 file
-v2_1_path = os.path.join(current_dir, 'app_pile_design_v2_1.py')
+import app_pile_design_v2_1 as _v21  # noqa: E402
 
-# Read and execute the v2.1 file
-with open(v2_1_path, 'r', encoding='utf-8') as f:
-    code = f.read()
-    exec(code, globals())
+# Streamlit executes the entry script as __main__
+if __name__ == "__main__":
+    _v21.main()
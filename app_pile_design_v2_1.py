@@ -35,136 +35,67 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 from datetime import datetime
-from typing import List, Dict
-import io
+from functools import lru_cache
+from itertools import starmap
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+import logging
+import traceback
+import uuid
+
+logger = logging.getLogger(__name__)
 
 # Import v2.1 calculation engine
 try:
     from calculations_v2_1 import (
         SoilType, PileType, LoadingType, AnalysisType, RelativeDensity,
         SoilPoint, SoilLayer, PileProperties, SoilProfile,
-        AxialCapacity, LateralCapacity, LoadDisplacementTables,
-        PileDesignAnalysis,
-        API_TABLE_1_EXTENDED, RESISTANCE_FACTORS, CARBONATE_REDUCTION_FACTORS,
+        AxialCapacity, PileDesignAnalysis,
+        API_TABLE_1_EXTENDED, CLAY_SOIL_TYPES, SAND_SOIL_TYPES,
         generate_design_soil_parameters_table,
     )
     CALC_ENGINE_AVAILABLE = True
 except ImportError:
     CALC_ENGINE_AVAILABLE = False
-    st.error("⚠️ calculations_v2_1.py not found! Please ensure it's in the same directory.")
+
+
+# Partial reruns: st.fragment (Streamlit >= 1.37), experimental in 1.33-1.36.
+# Older versions render the decorated block as part of the full script run.
+if hasattr(st, "fragment"):
+    _fragment = st.fragment
+elif hasattr(st, "experimental_fragment"):
+    _fragment = st.experimental_fragment
+else:
+    def _fragment(func):
+        return func
+_HAS_FRAGMENT = hasattr(st, "fragment") or hasattr(st, "experimental_fragment")
 
 
 # ============================================================================
 # PAGE CONFIGURATION & STYLING
 # ============================================================================
 
-st.set_page_config(
-    page_title="pile-SRI v2.6.1 · API RP 2GEO",
-    page_icon="🗝️",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
-
-# Enhanced color scheme with v2.1 branding
-st.markdown("""
-<style>
-    /* Modern gradient background */
-    .main { background: linear-gradient(135deg, #f5f7fa 0%, #ffffff 100%); }
-
-    /* Sidebar with gradient and WHITE TEXT */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(135deg, #0052CC 0%, #6B5BFF 100%);
-    }
-
-    [data-testid="stSidebar"] * {
-        color: white !important;
-    }
+CSS_PATH = Path(__file__).with_name("styles.css")
 
-    [data-testid="stSidebar"] label {
-        color: white !important;
-        font-weight: 600 !important;
-    }
 
-    [data-testid="stSidebar"] .stMarkdown {
-        color: white !important;
-    }
+@st.cache_resource(show_spinner=False)
+def _load_css() -> str:
+    """Global stylesheet, read from styles.css once per server process."""
+    return f"<style>\n{CSS_PATH.read_text(encoding='utf-8')}</style>"
 
 
-    /* Headers with gradient text (exclude sidebar h2/h3 to prevent visibility issues) */
-    h1, .main h2 {
-        background: linear-gradient(135deg, #0052CC 0%, #6B5BFF 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }
-
-    /* Ensure sidebar headings remain visible with contrasting background */
-    [data-testid="stSidebar"] h2, [data-testid="stSidebar"] h3 {
-        background: rgba(255, 255, 255, 0.2) !important;
-        -webkit-text-fill-color: white !important;
-        color: white !important;
-        text-shadow: 0 2px 4px rgba(0,0,0,0.3) !important;
-        padding: 8px 12px !important;
-        border-radius: 8px !important;
-        margin: 12px 0 !important;
-        font-weight: 700 !important;
-        border-left: 4px solid rgba(255, 255, 255, 0.5) !important;
-        backdrop-filter: blur(10px) !important;
-    }
-
-    /* Primary buttons */
-    .stButton > button {
-        background: linear-gradient(135deg, #0052CC 0%, #6B5BFF 100%) !important;
-        border: none;
-        border-radius: 8px;
-        font-weight: 600;
-        transition: all 0.3s;
-    }
-
-    .stButton > button:hover {
-        box-shadow: 0 8px 25px rgba(0, 82, 204, 0.3) !important;
-        transform: translateY(-2px);
-    }
-
-    /* Success/Warning badges */
-    .status-badge {
-        padding: 4px 12px;
-        border-radius: 12px;
-        font-size: 12px;
-        font-weight: 600;
-        display: inline-block;
-        margin: 4px;
-    }
-    
-    .status-good {
-        background: #10b981;
-        color: white;
-    }
-    
-    .status-adequate {
-        background: #f59e0b;
-        color: white;
-    }
-    
-    .status-warning {
-        background: #ef4444;
-        color: white;
-    }
+def configure_page():
+    """Apply page config and global CSS (must run on every script run)."""
+    st.set_page_config(
+        page_title="pile-SRI v2.6.1 · API RP 2GEO",
+        page_icon="🗝️",
+        layout="wide",
+        initial_sidebar_state="expanded",
+    )
 
-    /* Table styling */
-    .dataframe {
-        font-size: 13px;
-    }
-    
-    /* Metric cards */
-    [data-testid="stMetricValue"] {
-        font-size: 28px;
-        font-weight: 700;
-    }
-</style>
-""", unsafe_allow_html=True)
+    # Enhanced color scheme with v2.1 branding
+    st.markdown(_load_css(), unsafe_allow_html=True)
 
 
 # ============================================================================
@@ -198,6 +129,18 @@ def render_header():
 # SIDEBAR CONFIGURATION
 # ============================================================================
 
+@lru_cache(maxsize=32)
+def _parse_depths(text: str) -> tuple:
+    """Parse a comma-separated depth list (memoized on the raw text)."""
+    try:
+        depths = tuple(float(t) for t in text.split(',') if t.strip())
+    except ValueError:
+        raise ValueError(f"Could not read depths from '{text}'") from None
+    if not depths:
+        raise ValueError("No depths given")
+    return depths
+
+
 def render_sidebar() -> Dict:
     """Render enhanced sidebar with v2.1 options."""
     with st.sidebar:
@@ -264,8 +207,12 @@ def render_sidebar() -> Dict:
                     "5, 10, 15, 20, 25"
                 )
                 
-                tz_depths = [float(x.strip()) for x in tz_depths_input.split(',')]
-                py_depths = [float(x.strip()) for x in py_depths_input.split(',')]
+                try:
+                    tz_depths = _parse_depths(tz_depths_input)
+                    py_depths = _parse_depths(py_depths_input)
+                except ValueError as e:
+                    st.error(f"⚠️ {e} - using auto-generated depths")
+                    auto_depths = True
             else:
                 tz_depths = None
                 py_depths = None
@@ -289,386 +236,589 @@ def render_sidebar() -> Dict:
 # INPUT SECTIONS
 # ============================================================================
 
+_PILE_TYPE_OPTIONS = ("Driven Pipe (Open)", "Driven Pipe (Closed)", "Drilled Shaft", "Grouted")
+if CALC_ENGINE_AVAILABLE:
+    _PILE_TYPE_MAP = dict(zip(_PILE_TYPE_OPTIONS, [
+        PileType.DRIVEN_PIPE_OPEN,
+        PileType.DRIVEN_PIPE_CLOSED,
+        PileType.DRILLED_SHAFT,
+        PileType.GROUTED_PILE,
+    ]))
+
+
 def render_pile_input() -> PileProperties:
     """Render pile properties input."""
     st.subheader("🔨 Pile Properties")
 
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        diameter = st.number_input("Diameter (m)", 0.3, 5.0, 1.4, 0.1)
-    with col2:
-        thickness = st.number_input("Wall Thickness (m)", 0.01, 0.2, 0.016, 0.001)
-    with col3:
-        length = st.number_input("Embedded Length (m)", 1.0, 200.0, 35.0, 1.0)
-    with col4:
-        pile_type = st.selectbox(
-            "Pile Type",
-            ["Driven Pipe (Open)", "Driven Pipe (Closed)", "Drilled Shaft", "Grouted"],
-            help="Affects resistance factors"
-        )
-    
-    pile_type_map = {
-        "Driven Pipe (Open)": PileType.DRIVEN_PIPE_OPEN,
-        "Driven Pipe (Closed)": PileType.DRIVEN_PIPE_CLOSED,
-        "Drilled Shaft": PileType.DRILLED_SHAFT,
-        "Grouted": PileType.GROUTED_PILE,
-    }
+    # Batched in a form: edits only rerun the app when applied (or on Enter)
+    with st.form("pile_inputs", border=False):
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            diameter = st.number_input("Diameter (m)", 0.3, 5.0, 1.4, 0.1)
+        with col2:
+            thickness = st.number_input("Wall Thickness (m)", 0.01, 0.2, 0.016, 0.001)
+        with col3:
+            length = st.number_input("Embedded Length (m)", 1.0, 200.0, 35.0, 1.0)
+        with col4:
+            pile_type = st.selectbox(
+                "Pile Type",
+                _PILE_TYPE_OPTIONS,
+                help="Affects resistance factors"
+            )
+        st.form_submit_button("✔️ Apply Pile Properties", use_container_width=True)
 
     return PileProperties(
         diameter_m=diameter,
         wall_thickness_m=thickness,
         length_m=length,
-        pile_type=pile_type_map[pile_type]
+        pile_type=_PILE_TYPE_MAP[pile_type]
     )
 
 
-def render_soil_input() -> SoilProfile:
-    """Enhanced soil profile input with v2.1 features."""
-    st.subheader("🪨 Soil Profile")
+def _reset_points_editors(layer: Dict) -> None:
+    """Re-seed a layer's point editors after its points are changed in code."""
+    for key in [k for k in layer if k.endswith('_editor_base')]:
+        del layer[key]
+    layer['editor_version'] = layer.get('editor_version', 0) + 1
+
+
+def render_points_editor(layer: Dict, points_key: str, value_label: str) -> None:
+    """Editable depth/value grid bound to layer[points_key] (list of SoilPoints)."""
+    # The editor is seeded once from the stored points; its output is the new list
+    base_key = f"{points_key}_editor_base"
+    if base_key not in layer:
+        layer[base_key] = _points_df(_points_digest(layer[points_key]), value_label)
+
+    key = f"editor_{points_key}_{layer['uid']}_{layer.get('editor_version', 0)}"
+    edited = st.data_editor(
+        layer[base_key],
+        num_rows="dynamic",
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            # Fixed bounds keep the editor config stable; layer range is applied below
+            'Depth (m)': st.column_config.NumberColumn(min_value=0.0, max_value=200.0, step=0.1),
+            value_label: st.column_config.NumberColumn(min_value=0.0),
+        },
+        key=key,
+    )
 
-    col1, col2 = st.columns(2)
-    with col1:
-        site_name = st.text_input("Site Name", "Offshore Site")
-    with col2:
-        water_depth = st.number_input("Water Depth (m)", 0, 3000, 50, 10)
+    # No pending edits: the grid still matches the stored points it was seeded from
+    changes = st.session_state.get(key, {})
+    if not (changes.get('edited_rows') or changes.get('added_rows') or changes.get('deleted_rows')):
+        return
+
+    # Clamp depths to the layer, stable sort by depth in pandas, then build the points
+    edited = edited.dropna()
+    edited['Depth (m)'] = edited['Depth (m)'].clip(layer['z_top'], layer['z_bot'])
+    edited = edited.sort_values('Depth (m)', kind='stable')
+    layer[points_key] = [
+        SoilPoint(depth, value) for depth, value in edited.itertuples(index=False, name=None)
+    ]
+
+
+def _points_digest(points) -> tuple:
+    """Hashable (depth, value) tuple for a list of SoilPoints."""
+    return tuple((p.depth_m, p.value) for p in points)
+
+
+@st.cache_data(max_entries=256)
+def _points_df(points: tuple, value_label: str) -> pd.DataFrame:
+    """Two-column (depth, value) table for a _points_digest tuple."""
+    return pd.DataFrame(np.array(points, dtype=float).reshape(-1, 2),
+                        columns=['Depth (m)', value_label])
+
+
+def _layers_digest(layers_data: Iterable[Dict]) -> tuple:
+    """Hashable snapshot of the session-state layer dicts."""
+    return tuple(
+        (
+            layer['name'],
+            layer['type'],
+            layer['z_top'],
+            layer['z_bot'],
+            _points_digest(layer['gamma_points']),
+            _points_digest(layer['su_points']),
+            _points_digest(layer['phi_points']),
+            _points_digest(layer['epsilon_50_points']),
+            layer.get('relative_density', 50.0),
+            layer.get('carbonate_content', 0.0),
+            layer.get('is_cemented', False),
+        )
+        for layer in layers_data
+    )
+
+
+def _convert_to_layers(digest: tuple) -> List[SoilLayer]:
+    """Build SoilLayer objects from a layer digest (see _layers_digest)."""
+    # One pass over the digest rows; points are built with starmap (no per-point lambda)
+    return [
+        SoilLayer(
+            name=name,
+            soil_type=SoilType(soil_type),
+            depth_top_m=z_top,
+            depth_bot_m=z_bot,
+            gamma_prime_kNm3=list(starmap(SoilPoint, gamma)),
+            su_kPa=list(starmap(SoilPoint, su)),
+            phi_prime_deg=list(starmap(SoilPoint, phi)),
+            # k_kNm3 is auto-calculated from API Table 5 based on phi_prime
+            epsilon_50_pct=list(starmap(SoilPoint, eps50)),
+            relative_density_pct=relative_density,
+            carbonate_content_pct=carbonate_content,
+            is_cemented=is_cemented,
+        )
+        for (name, soil_type, z_top, z_bot, gamma, su, phi, eps50,
+             relative_density, carbonate_content, is_cemented) in digest
+    ]
 
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _build_profile(site_name: str, water_depth: float, digest: tuple) -> SoilProfile:
+    """SoilProfile for a layer digest (each rerun gets its own copy)."""
     profile = SoilProfile(site_name=site_name, water_depth_m=water_depth)
+    profile.layers.extend(_convert_to_layers(digest))
+    return profile
 
-    # Initialize session state
-    if 'soil_layers_v21' not in st.session_state:
-        st.session_state.soil_layers_v21 = []
 
-    # Add new layer button
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col1:
-        if st.button("➕ Add Layer", use_container_width=True, type="primary"):
-            st.session_state.soil_layers_v21.append({
-                'name': f"Layer {len(st.session_state.soil_layers_v21)+1}",
-                'type': 'clay',
-                'z_top': 0.0 if not st.session_state.soil_layers_v21 else st.session_state.soil_layers_v21[-1]['z_bot'],
-                'z_bot': (0.0 if not st.session_state.soil_layers_v21 else st.session_state.soil_layers_v21[-1]['z_bot']) + 5.0,
-                'gamma_points': [],
-                'su_points': [],
-                'phi_points': [],
-                'relative_density': 50.0,
-                'carbonate_content': 0.0,
-                'is_cemented': False,
-            })
-            st.rerun()
+_SOIL_TYPES = ("clay", "silt", "sand", "sand-silt")
+
+
+def _reset_layer_table() -> None:
+    """Re-seed the layer table after layers are added or removed in code."""
+    st.session_state.pop('layer_table_base', None)
+    st.session_state.layer_table_version = st.session_state.get('layer_table_version', 0) + 1
+
+
+def render_layer_table(layers: List[Dict]) -> None:
+    """Editable grid of the per-layer scalar inputs, written back to the layer dicts."""
+    # Seeded once from the layer dicts (like render_points_editor); rebuilt if out of step
+    base = st.session_state.get('layer_table_base')
+    if base is None or len(base) != len(layers):
+        if base is not None:
+            _reset_layer_table()
+        base = pd.DataFrame({
+            'Name': [layer['name'] for layer in layers],
+            'Type': [layer['type'] for layer in layers],
+            'Top (m)': np.fromiter((layer['z_top'] for layer in layers), dtype=float, count=len(layers)),
+            'Bottom (m)': np.fromiter((layer['z_bot'] for layer in layers), dtype=float, count=len(layers)),
+            'Dr (%)': np.fromiter((layer.get('relative_density', 50.0) for layer in layers),
+                                  dtype=float, count=len(layers)),
+            'Carbonate (%)': np.fromiter((layer.get('carbonate_content', 0.0) for layer in layers),
+                                         dtype=float, count=len(layers)),
+            'Cemented': [bool(layer.get('is_cemented', False)) for layer in layers],
+        })
+        st.session_state.layer_table_base = base
+
+    edited = st.data_editor(
+        base,
+        num_rows="fixed",
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Name': st.column_config.TextColumn(required=True),
+            'Type': st.column_config.SelectboxColumn(options=_SOIL_TYPES, required=True),
+            'Top (m)': st.column_config.NumberColumn(
+                min_value=0.0, max_value=200.0, step=0.5, required=True),
+            'Bottom (m)': st.column_config.NumberColumn(
+                min_value=0.0, max_value=200.0, step=0.5, required=True,
+                help="Layer bottom depth (max 200m for deep analyses)"),
+            'Dr (%)': st.column_config.NumberColumn(
+                min_value=0.0, max_value=100.0, step=5.0, required=True,
+                help="Relative density, sands only (API Table 1 parameter selection)"),
+            'Carbonate (%)': st.column_config.NumberColumn(
+                min_value=0.0, max_value=100.0, step=5.0, required=True,
+                help="For carbonate soil reduction factors"),
+            'Cemented': st.column_config.CheckboxColumn(
+                help="Cemented carbonate can exceed silica strength"),
+        },
+        key=f"layer_table_{st.session_state.get('layer_table_version', 0)}",
+    )
 
-    # Display layers
-    for idx, layer in enumerate(st.session_state.soil_layers_v21):
-        with st.expander(
-            f"**{layer['name']}** ({layer['type']}, {layer['z_top']:.1f}-{layer['z_bot']:.1f}m)",
-            expanded=True
-        ):
-            # Basic properties
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                layer['name'] = st.text_input("Name", value=layer['name'], key=f"name_{idx}")
-            with col2:
-                layer['type'] = st.selectbox(
-                    "Type",
-                    ["clay", "silt", "sand", "sand-silt"],
-                    index=["clay", "silt", "sand", "sand-silt"].index(layer['type']),
-                    key=f"type_{idx}"
-                )
-            with col3:
-                layer['z_top'] = st.number_input("Top (m)", value=layer['z_top'], step=0.5, key=f"ztop_{idx}")
-            with col4:
-                layer['z_bot'] = st.number_input("Bottom (m)", value=layer['z_bot'], step=0.5,
-                                                 max_value=200.0, key=f"zbot_{idx}",
-                                                 help="Layer bottom depth (max 200m for deep analyses)")
+    for layer, (name, soil_type, z_top, z_bot, dr, carbonate, cemented) in zip(
+            layers, edited.itertuples(index=False, name=None)):
+        layer['name'] = name
+        layer['type'] = soil_type
+        # Only ordered ranges are kept (SoilLayer rejects bottom <= top)
+        if z_bot > z_top:
+            layer['z_top'] = float(z_top)
+            layer['z_bot'] = float(z_bot)
+        else:
+            st.warning(f"⚠️ {name}: bottom must be below top - keeping "
+                       f"{layer['z_top']:.1f}-{layer['z_bot']:.1f}m")
+        layer['relative_density'] = float(dr)
+        layer['carbonate_content'] = float(carbonate)
+        layer['is_cemented'] = bool(cemented)
+
+
+# Layer actions run as button callbacks, i.e. before the script reruns, so the
+# change is already in session state when the page is rendered. Layers live in
+# an insertion-ordered dict keyed by a stable uid, which also keys their widgets.
+
+def _add_layer():
+    """Append a new layer below the current last layer."""
+    layers = st.session_state.soil_layers_v21
+    z_top = 0.0 if not layers else next(reversed(layers.values()))['z_bot']
+    uid = uuid.uuid4().hex
+    layers[uid] = {
+        'name': f"Layer {len(layers)+1}",
+        'type': 'clay',
+        'z_top': z_top,
+        'z_bot': z_top + 5.0,
+        'gamma_points': [],
+        'su_points': [],
+        'phi_points': [],
+        'epsilon_50_points': [],
+        'relative_density': 50.0,
+        'carbonate_content': 0.0,
+        'is_cemented': False,
+        'uid': uid,
+    }
+    _reset_layer_table()
+
+
+def _delete_layer(uid: str):
+    """Remove the layer with this uid."""
+    del st.session_state.soil_layers_v21[uid]
+    _reset_layer_table()
+
+
+def _duplicate_layer(uid: str):
+    """Insert a copy of the layer with this uid directly below it."""
+    layers = st.session_state.soil_layers_v21
+    layer = layers[uid]
+    new_layer = layer.copy()
+    # Own point lists (SoilPoints are immutable, so shallow list copies suffice)
+    for points_key in ('gamma_points', 'su_points', 'phi_points', 'epsilon_50_points'):
+        new_layer[points_key] = list(layer[points_key])
+    new_layer['name'] = f"{layer['name']} (Copy)"
+    new_layer['z_top'] = layer['z_bot']
+    new_layer['z_bot'] = layer['z_bot'] + (layer['z_bot'] - layer['z_top'])
+    new_layer['uid'] = uuid.uuid4().hex
+    _reset_points_editors(new_layer)
+    # Dicts cannot insert mid-order, so rebuild with the copy after its source
+    reordered = {}
+    for key, value in layers.items():
+        reordered[key] = value
+        if key == uid:
+            reordered[new_layer['uid']] = new_layer
+    st.session_state.soil_layers_v21 = reordered
+    _reset_layer_table()
+
+
+def _clear_layers():
+    """Remove all layers."""
+    st.session_state.soil_layers_v21 = {}
+    _reset_layer_table()
+
+
+# Quick-fill values: linear profiles are (layer top, layer bottom)
+_LINEAR_GAMMA = (7.0, 8.5)      # γ' (kN/m³)
+_LINEAR_SU = (20.0, 50.0)       # Su (kPa)
+_LINEAR_PHI = (30.0, 35.0)      # φ' (deg)
+_MARINE_CLAY_GAMMA = 6.5        # γ' (kN/m³)
+_MARINE_CLAY_SU = 15.0          # Su at layer top (kPa)
+_MARINE_CLAY_SU_GRADIENT = 1.5  # Su increase (kPa/m)
+_MARINE_SAND_GAMMA = 9.8        # γ' (kN/m³)
+_MARINE_SAND_PHI = 35.0         # φ' (deg)
+_MARINE_SAND_DR = 75.0          # Dr (%)
+
+
+def _set_points(layer: Dict, points_key: str, points: List[SoilPoint]) -> bool:
+    """Store points on the layer; False (and no write) if they are unchanged."""
+    if layer[points_key] == points:
+        return False
+    layer[points_key] = points
+    return True
+
+
+def _fill_linear_profile(uid: str):
+    """Auto-fill empty profiles of the layer with this uid with linear profiles."""
+    layer = st.session_state.soil_layers_v21[uid]
+    changed = False
+    if not layer['gamma_points']:
+        changed |= _set_points(layer, 'gamma_points', [
+            SoilPoint(layer['z_top'], _LINEAR_GAMMA[0]),
+            SoilPoint(layer['z_bot'], _LINEAR_GAMMA[1])
+        ])
 
-            st.markdown("---")
-            
-            # Tabs for different inputs
-            tab1, tab2, tab3, tab4 = st.tabs(["📊 Soil Data", "🎯 Enhanced Properties", "⚡ Quick Fill", "🗑️ Actions"])
+    if layer['type'] in ['clay', 'silt'] and not layer['su_points']:
+        changed |= _set_points(layer, 'su_points', [
+            SoilPoint(layer['z_top'], _LINEAR_SU[0]),
+            SoilPoint(layer['z_bot'], _LINEAR_SU[1])
+        ])
+    elif layer['type'] in ['sand', 'sand-silt'] and not layer['phi_points']:
+        changed |= _set_points(layer, 'phi_points', [
+            SoilPoint(layer['z_top'], _LINEAR_PHI[0]),
+            SoilPoint(layer['z_bot'], _LINEAR_PHI[1])
+        ])
+    # Repeat clicks change nothing, so the editors keep their state
+    if changed:
+        _reset_points_editors(layer)
+
+
+def _fill_typical_marine(uid: str):
+    """Fill the layer with this uid with typical marine clay/sand parameters."""
+    layer = st.session_state.soil_layers_v21[uid]
+    changed = False
+    if layer['type'] == 'clay':
+        changed |= _set_points(layer, 'gamma_points', [SoilPoint(layer['z_top'], _MARINE_CLAY_GAMMA)])
+        changed |= _set_points(layer, 'su_points', [
+            SoilPoint(layer['z_top'], _MARINE_CLAY_SU),
+            SoilPoint(layer['z_bot'],
+                      _MARINE_CLAY_SU + (layer['z_bot'] - layer['z_top']) * _MARINE_CLAY_SU_GRADIENT)
+        ])
+    elif layer['type'] == 'sand':
+        changed |= _set_points(layer, 'gamma_points', [SoilPoint(layer['z_top'], _MARINE_SAND_GAMMA)])
+        changed |= _set_points(layer, 'phi_points', [SoilPoint(layer['z_top'], _MARINE_SAND_PHI)])
+        if layer['relative_density'] != _MARINE_SAND_DR:
+            layer['relative_density'] = _MARINE_SAND_DR
+            _reset_layer_table()
+    if changed:
+        _reset_points_editors(layer)
+
+
+# Bound str.format methods for the summary table and layer expander labels
+_DEPTHS_FMT = "{:.1f}-{:.1f}m".format
+_PCT_FMT = "{:.0f}".format
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _summary_df(digest: tuple) -> pd.DataFrame:
+    """Profile summary table from a layer digest (see _layers_digest).
+
+    Held as a resource: the same frame is returned on each rerun instead of an
+    unpickled copy. It is display-only and never modified.
+    """
+    return pd.DataFrame({
+        'Name': [d[0] for d in digest],
+        'Type': [d[1] for d in digest],
+        'Depths': [_DEPTHS_FMT(d[2], d[3]) for d in digest],
+        'γ\' pts': [len(d[4]) for d in digest],
+        'Strength pts': [len(d[5]) + len(d[6]) for d in digest],
+        'Dr %': [_PCT_FMT(d[8]) if d[1] in ['sand', 'sand-silt'] else '—' for d in digest],
+        'Carbonate %': list(map(_PCT_FMT, (d[9] for d in digest))),
+    }, index=pd.RangeIndex(1, len(digest) + 1, name='#'))
+
+
+def _layer_list_button(label: str, key: str, action, uid: str) -> None:
+    """Button for an action that changes the layer list or table (the whole page)."""
+    if _HAS_FRAGMENT:
+        # A click inside a fragment only reruns the fragment, so rerun the app once
+        if st.button(label, key=key, use_container_width=True):
+            action(uid)
+            st.rerun()
+    else:
+        # Full-script run: a callback applies the change before the only rerun
+        st.button(label, key=key, use_container_width=True, on_click=action, args=(uid,))
+
+
+_DR_CLASS_COLORS = {
+    "very_loose": "🔴",
+    "loose": "🟠",
+    "medium_dense": "🟡",
+    "dense": "🟢",
+    "very_dense": "🔵"
+}
+
+
+@lru_cache(maxsize=32)
+def _dr_info(relative_density: float) -> Tuple[str, str]:
+    """(emoji, label) for a relative density classification."""
+    dr_class = RelativeDensity.from_percentage(relative_density)
+    return _DR_CLASS_COLORS.get(dr_class.value, '⚪'), dr_class.value.replace('_', ' ').title()
+
+
+LAYER_SECTIONS = ["📊 Soil Data", "🎯 Enhanced Properties", "⚡ Quick Fill", "🗑️ Actions"]
+
+
+@_fragment
+def _render_layer(uid: str, layer: Dict) -> None:
+    """One layer's expander; its widgets rerun only this fragment."""
+    with st.expander(
+        f"**{layer['name']}** ({layer['type']}, {_DEPTHS_FMT(layer['z_top'], layer['z_bot'])})",
+        expanded=True
+    ):
+        # Only the selected section is built (tabs would build all four)
+        section = st.radio("Section", LAYER_SECTIONS, horizontal=True,
+                           key=f"section_{uid}", label_visibility="collapsed")
+
+        # The point editors are not shown, so re-seed them from the stored points
+        if section != LAYER_SECTIONS[0] and any(k.endswith('_editor_base') for k in layer):
+            _reset_points_editors(layer)
+
+        # Section 1: Soil data points
+        if section == LAYER_SECTIONS[0]:
+            st.caption(f"Point depths are clamped to the layer range: "
+                       f"{_DEPTHS_FMT(layer['z_top'], layer['z_bot'])}")
+            # For clays: show gamma, Su, and epsilon_50
+            # For sands: show gamma and phi only (k is auto-calculated from API Table 5)
+            if layer['type'] in ['clay', 'silt']:
+                col_g, col_s, col_eps = st.columns(3)
+            else:
+                col_g, col_s = st.columns(2)
+
+            # Gamma prime
+            with col_g:
+                st.markdown("**γ' (kN/m³)**")
+                render_points_editor(layer, 'gamma_points', 'γ\' (kN/m³)')
 
-            # Tab 1: Soil data points
-            with tab1:
-                # For clays: show gamma, Su, and epsilon_50
-                # For sands: show gamma and phi only (k is auto-calculated from API Table 5)
+            # Strength parameters
+            with col_s:
                 if layer['type'] in ['clay', 'silt']:
-                    col_g, col_s, col_eps = st.columns(3)
+                    st.markdown("**Su (kPa)**")
+                    render_points_editor(layer, 'su_points', 'Su (kPa)')
                 else:
-                    col_g, col_s = st.columns(2)
-
-                # Gamma prime
-                with col_g:
-                    st.markdown("**γ' (kN/m³)**")
-                    with st.form(f"add_gamma_{idx}"):
-                        c1, c2, c3 = st.columns([1, 1, 1])
-                        with c1:
-                            gz = st.number_input("Depth", value=layer['z_top'],
-                                               min_value=layer['z_top'], max_value=200.0,
-                                               step=0.1, key=f"gz_{idx}")
-                        with c2:
-                            gv = st.number_input("γ'", value=8.0, step=0.5, key=f"gv_{idx}")
-                        with c3:
-                            if st.form_submit_button("Add", use_container_width=True):
-                                if 'gamma_points' not in layer:
-                                    layer['gamma_points'] = []
-                                layer['gamma_points'].append(SoilPoint(gz, gv))
-                                layer['gamma_points'].sort(key=lambda p: p.depth_m)
-                                st.rerun()
-
-                    if layer.get('gamma_points'):
-                        df = pd.DataFrame([
-                            {'Depth (m)': p.depth_m, 'γ\' (kN/m³)': p.value}
-                            for p in layer['gamma_points']
-                        ])
-                        st.dataframe(df, use_container_width=True, hide_index=True)
-
-                # Strength parameters
-                with col_s:
-                    if layer['type'] in ['clay', 'silt']:
-                        st.markdown("**Su (kPa)**")
-                        param_points = 'su_points'
-                        param_label = 'Su (kPa)'
-                        default_val = 30.0
-                    else:
-                        st.markdown("**φ' (deg)**")
-                        param_points = 'phi_points'
-                        param_label = 'φ\' (deg)'
-                        default_val = 32.0
-
-                    with st.form(f"add_param_{idx}"):
-                        c1, c2, c3 = st.columns([1, 1, 1])
-                        with c1:
-                            pz = st.number_input("Depth", value=layer['z_top'],
-                                               min_value=layer['z_top'], max_value=200.0,
-                                               step=0.1, key=f"pz_{idx}")
-                        with c2:
-                            pv = st.number_input(param_label, value=default_val, step=5.0, key=f"pv_{idx}")
-                        with c3:
-                            if st.form_submit_button("Add", use_container_width=True):
-                                if param_points not in layer:
-                                    layer[param_points] = []
-                                layer[param_points].append(SoilPoint(pz, pv))
-                                layer[param_points].sort(key=lambda p: p.depth_m)
-                                st.rerun()
-
-                    if layer.get(param_points):
-                        df = pd.DataFrame([
-                            {'Depth (m)': p.depth_m, param_label: p.value}
-                            for p in layer[param_points]
-                        ])
-                        st.dataframe(df, use_container_width=True, hide_index=True)
-
-                # Epsilon_50 for clays only (from UU testing)
-                if layer['type'] in ['clay', 'silt']:
-                    with col_eps:
-                        st.markdown("**ε₅₀ (%)** ⭐")
-                        st.caption("Optional: from UU testing")
-                        with st.form(f"add_eps_{idx}"):
-                            c1, c2, c3 = st.columns([1, 1, 1])
-                            with c1:
-                                eps_z = st.number_input("Depth", value=layer['z_top'],
-                                                       min_value=layer['z_top'], max_value=200.0,
-                                                       step=0.1, key=f"epsz_{idx}")
-                            with c2:
-                                eps_v = st.number_input("ε₅₀ (%)", value=2.0, step=0.1, key=f"epsv_{idx}",
-                                                       help="Strain at 50% capacity from UU testing. Default: 2.0%")
-                            with c3:
-                                if st.form_submit_button("Add", use_container_width=True):
-                                    if 'epsilon_50_points' not in layer:
-                                        layer['epsilon_50_points'] = []
-                                    layer['epsilon_50_points'].append(SoilPoint(eps_z, eps_v))
-                                    layer['epsilon_50_points'].sort(key=lambda p: p.depth_m)
-                                    st.rerun()
-
-                        if layer.get('epsilon_50_points'):
-                            df = pd.DataFrame([
-                                {'Depth (m)': p.depth_m, 'ε₅₀ (%)': p.value}
-                                for p in layer['epsilon_50_points']
-                            ])
-                            st.dataframe(df, use_container_width=True, hide_index=True)
-                        else:
-                            st.info("ℹ️ Using default: 2.0%")
+                    st.markdown("**φ' (deg)**")
+                    render_points_editor(layer, 'phi_points', 'φ\' (deg)')
+
+            # Epsilon_50 for clays only (from UU testing)
+            if layer['type'] in ['clay', 'silt']:
+                with col_eps:
+                    st.markdown("**ε₅₀ (%)** ⭐")
+                    st.caption("Optional: from UU testing")
+                    render_points_editor(layer, 'epsilon_50_points', 'ε₅₀ (%)')
+
+                    if not layer['epsilon_50_points']:
+                        st.info("ℹ️ Using default: 2.0%")
+
+            # Info for sands about k calculation
+            if layer['type'] in ['sand', 'sand-silt']:
+                st.info("ℹ️ **k** (subgrade modulus) is automatically calculated from API RP 2GEO Table 5 based on φ'")
+
+        # Section 2: Enhanced v2.1 properties
+        elif section == LAYER_SECTIONS[1]:
+            st.markdown("**🆕 v2.1 Enhanced Properties**")
+            st.caption("Edit Dr, carbonate content and cementation in the layer table above")
+
+            col1, col2, col3 = st.columns(3)
 
-                # Info for sands about k calculation
+            # Relative Density (for sands)
+            with col1:
                 if layer['type'] in ['sand', 'sand-silt']:
-                    st.info("ℹ️ **k** (subgrade modulus) is automatically calculated from API RP 2GEO Table 5 based on φ'")
+                    # Show classification
+                    emoji, label = _dr_info(layer.get('relative_density', 50.0))
+                    st.info(f"{emoji} {label}")
+                else:
+                    st.info("Relative density only for sands")
 
-            # Tab 2: Enhanced v2.1 properties
-            with tab2:
-                st.markdown("**🆕 v2.1 Enhanced Properties**")
-                
-                col1, col2, col3 = st.columns(3)
-                
-                # Relative Density (for sands)
-                with col1:
-                    if layer['type'] in ['sand', 'sand-silt']:
-                        layer['relative_density'] = st.slider(
-                            "Relative Density (%)",
-                            0, 100, int(layer.get('relative_density', 50)),
-                            5,
-                            key=f"dr_{idx}",
-                            help="For API Table 1 parameter selection"
-                        )
-                        
-                        # Show classification
-                        dr_class = RelativeDensity.from_percentage(layer['relative_density'])
-                        class_colors = {
-                            "very_loose": "🔴",
-                            "loose": "🟠",
-                            "medium_dense": "🟡",
-                            "dense": "🟢",
-                            "very_dense": "🔵"
-                        }
-                        st.info(f"{class_colors.get(dr_class.value, '⚪')} {dr_class.value.replace('_', ' ').title()}")
+            # Carbonate content
+            with col2:
+                if layer.get('carbonate_content', 0.0) > 30:
+                    if layer['carbonate_content'] > 70:
+                        st.warning("⚠️ High carbonate (>70%)")
                     else:
-                        st.info("Relative density only for sands")
+                        st.info("ℹ️ Moderate carbonate (30-70%)")
 
-                # Carbonate content
-                with col2:
-                    layer['carbonate_content'] = st.slider(
-                        "Carbonate Content (%)",
-                        0, 100, int(layer.get('carbonate_content', 0)),
-                        5,
-                        key=f"carb_{idx}",
-                        help="For carbonate soil reduction factors"
-                    )
-                    
-                    if layer['carbonate_content'] > 30:
-                        if layer['carbonate_content'] > 70:
-                            st.warning("⚠️ High carbonate (>70%)")
-                        else:
-                            st.info("ℹ️ Moderate carbonate (30-70%)")
+            # Cementation
+            with col3:
+                if layer.get('is_cemented', False):
+                    st.success("✅ Cemented (capacity increase)")
 
-                # Cementation
-                with col3:
-                    layer['is_cemented'] = st.checkbox(
-                        "Cemented Soil",
-                        value=layer.get('is_cemented', False),
-                        key=f"cem_{idx}",
-                        help="Cemented carbonate can exceed silica strength"
-                    )
-                    
-                    if layer['is_cemented']:
-                        st.success("✅ Cemented (capacity increase)")
+        # Section 3: Quick fill
+        elif section == LAYER_SECTIONS[2]:
+            st.markdown("**⚡ Quick Fill Options**")
 
-            # Tab 3: Quick fill
-            with tab3:
-                st.markdown("**⚡ Quick Fill Options**")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button(f"🎯 Linear Profile", key=f"linear_{idx}", use_container_width=True):
-                        # Auto-fill with linear profiles
-                        if not layer.get('gamma_points'):
-                            layer['gamma_points'] = [
-                                SoilPoint(layer['z_top'], 7.0),
-                                SoilPoint(layer['z_bot'], 8.5)
-                            ]
-                        
-                        if layer['type'] in ['clay', 'silt'] and not layer.get('su_points'):
-                            layer['su_points'] = [
-                                SoilPoint(layer['z_top'], 20.0),
-                                SoilPoint(layer['z_bot'], 50.0)
-                            ]
-                        elif layer['type'] in ['sand', 'sand-silt'] and not layer.get('phi_points'):
-                            layer['phi_points'] = [
-                                SoilPoint(layer['z_top'], 30.0),
-                                SoilPoint(layer['z_bot'], 35.0)
-                            ]
-                        st.rerun()
-                
-                with col2:
-                    if st.button(f"🌊 Typical Marine", key=f"marine_{idx}", use_container_width=True):
-                        if layer['type'] == 'clay':
-                            layer['gamma_points'] = [SoilPoint(layer['z_top'], 6.5)]
-                            layer['su_points'] = [
-                                SoilPoint(layer['z_top'], 15.0),
-                                SoilPoint(layer['z_bot'], 15.0 + (layer['z_bot'] - layer['z_top']) * 1.5)
-                            ]
-                        elif layer['type'] == 'sand':
-                            layer['gamma_points'] = [SoilPoint(layer['z_top'], 9.8)]
-                            layer['phi_points'] = [SoilPoint(layer['z_top'], 35.0)]
-                            layer['relative_density'] = 75.0
-                        st.rerun()
-
-            # Tab 4: Actions
-            with tab4:
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button(f"🗑️ Delete Layer", key=f"del_{idx}", use_container_width=True):
-                        st.session_state.soil_layers_v21.pop(idx)
-                        st.rerun()
-                
-                with col2:
-                    if st.button(f"📋 Duplicate", key=f"dup_{idx}", use_container_width=True):
-                        new_layer = layer.copy()
-                        new_layer['name'] = f"{layer['name']} (Copy)"
-                        new_layer['z_top'] = layer['z_bot']
-                        new_layer['z_bot'] = layer['z_bot'] + (layer['z_bot'] - layer['z_top'])
-                        st.session_state.soil_layers_v21.insert(idx + 1, new_layer)
-                        st.rerun()
+            col1, col2 = st.columns(2)
+            with col1:
+                st.button("🎯 Linear Profile", key=f"linear_{uid}", use_container_width=True,
+                          on_click=_fill_linear_profile, args=(uid,))
+
+            with col2:
+                # Sets Dr on sands, which the layer table outside this fragment shows
+                _layer_list_button("🌊 Typical Marine", f"marine_{uid}", _fill_typical_marine, uid)
+
+        # Section 4: Actions
+        else:
+            col1, col2 = st.columns(2)
+            with col1:
+                _layer_list_button("🗑️ Delete Layer", f"del_{uid}", _delete_layer, uid)
+
+            with col2:
+                _layer_list_button("📋 Duplicate", f"dup_{uid}", _duplicate_layer, uid)
+
+
+def render_soil_input() -> SoilProfile:
+    """Enhanced soil profile input with v2.1 features."""
+    st.subheader("🪨 Soil Profile")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        site_name = st.text_input("Site Name", "Offshore Site")
+    with col2:
+        water_depth = st.number_input("Water Depth (m)", 0, 3000, 50, 10)
+
+    # Initialize session state. Live reference: layer callbacks have already run,
+    # so this is the dict to render
+    layers = st.session_state.setdefault('soil_layers_v21', {})
+
+    # Add new layer button
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button("➕ Add Layer", use_container_width=True, type="primary", on_click=_add_layer)
+
+    # Layer geometry for the whole profile in one grid
+    if layers:
+        render_layer_table(list(layers.values()))
+
+    # Display layers (each in its own fragment)
+    for uid, layer in list(layers.items()):
+        _render_layer(uid, layer)
 
     # Summary
-    if st.session_state.soil_layers_v21:
+    if layers:
         st.markdown("---")
         st.markdown("### 📊 Profile Summary")
 
-        summary_data = []
-        for i, layer in enumerate(st.session_state.soil_layers_v21):
-            summary_data.append({
-                '#': i+1,
-                'Name': layer['name'],
-                'Type': layer['type'],
-                'Depths': f"{layer['z_top']:.1f}-{layer['z_bot']:.1f}m",
-                'γ\' pts': len(layer.get('gamma_points', [])),
-                'Strength pts': len(layer.get('su_points', [])) + len(layer.get('phi_points', [])),
-                'Dr %': f"{layer.get('relative_density', 0):.0f}" if layer['type'] in ['sand', 'sand-silt'] else '—',
-                'Carbonate %': f"{layer.get('carbonate_content', 0):.0f}",
-            })
-
-        st.dataframe(pd.DataFrame(summary_data), use_container_width=True, hide_index=True)
+        # One digest per run: keys the summary, the layer conversion and validation
+        digest = _layers_digest(layers.values())
+        st.session_state['_soil_digest'] = digest
+        st.table(_summary_df(digest))
 
         # Clear all
-        if st.button("🗑️ Clear All Layers", use_container_width=True):
-            st.session_state.soil_layers_v21 = []
-            st.rerun()
+        st.button("🗑️ Clear All Layers", use_container_width=True, on_click=_clear_layers)
 
-        # Convert to SoilProfile
-        for layer_data in st.session_state.soil_layers_v21:
-            layer = SoilLayer(
-                name=layer_data['name'],
-                soil_type=SoilType(layer_data['type']),
-                depth_top_m=layer_data['z_top'],
-                depth_bot_m=layer_data['z_bot'],
-                gamma_prime_kNm3=layer_data.get('gamma_points', []),
-                su_kPa=layer_data.get('su_points', []),
-                phi_prime_deg=layer_data.get('phi_points', []),
-                # k_kNm3 is auto-calculated from API Table 5 based on phi_prime
-                epsilon_50_pct=layer_data.get('epsilon_50_points', []),
-                relative_density_pct=layer_data.get('relative_density', 50.0),
-                carbonate_content_pct=layer_data.get('carbonate_content', 0.0),
-                is_cemented=layer_data.get('is_cemented', False),
-            )
-            profile.layers.append(layer)
     else:
+        digest = ()
         st.info("👆 Click 'Add Layer' to start building your soil profile")
 
-    return profile
+    # Convert to SoilProfile (cached on the site inputs and layer digest)
+    return _build_profile(site_name, water_depth, digest)
 
 
 # ============================================================================
 # RESULTS & VISUALIZATION
 # ============================================================================
 
-def create_capacity_plots(results: Dict, config: Dict):
-    """Create enhanced 3-panel capacity plots."""
-    
-    # Compression
-    df_comp = results['capacity_compression_df']
-    
+# WebGL traces only pay off for large point counts; small plots stay SVG
+SCATTERGL_MIN_POINTS = 1000
+# Longer depth profiles are LTTB-downsampled to this many points per trace
+PLOT_MAX_POINTS = 2000
+
+
+def _scatter_cls(n_points: int):
+    """go.Scattergl for large traces, go.Scatter otherwise."""
+    return go.Scattergl if n_points > SCATTERGL_MIN_POINTS else go.Scatter
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def create_capacity_plots(df_comp: pd.DataFrame, df_tens: pd.DataFrame = None):
+    """Create enhanced 3-panel capacity plots (shared across reruns for unchanged profiles)."""
+    # Imported on first use (streamlit already loads plotly.graph_objects itself)
+    from plotly.subplots import make_subplots
+
+    # Compression (column arrays, one point per depth increment)
+    depth_comp = df_comp['depth_m'].to_numpy()
+
     # Tension (if analyzed)
-    if 'Tension' in config['analysis_types']:
-        df_tens = results['capacity_tension_df']
-    else:
-        df_tens = None
+    if df_tens is not None:
+        depth_tens = df_tens['depth_m'].to_numpy()
+    Scatter = _scatter_cls(min(len(depth_comp), PLOT_MAX_POINTS))
+
+    def xy(df: pd.DataFrame, column: str, depth: np.ndarray) -> Dict:
+        """x (values) and y (depths) of one trace, downsampled if the profile is long."""
+        values = df[column].to_numpy(dtype=float)
+        keep = _lttb_indices(depth, values, PLOT_MAX_POINTS)
+        return dict(x=values[keep], y=depth[keep])
 
     # Create 3-panel figure
     fig = make_subplots(
@@ -677,67 +827,57 @@ def create_capacity_plots(results: Dict, config: Dict):
         horizontal_spacing=0.08
     )
 
+    # Traces are collected with their panel and added in one call
+    traces, cols = [], []
+
     # Panel 1: Unit Friction
-    fig.add_trace(
-        go.Scatter(
-            x=df_comp['unit_friction_kPa'],
-            y=df_comp['depth_m'],
-            name='Compression',
-            line=dict(color='#0052CC', width=2),
-            mode='lines',
-        ),
-        row=1, col=1
-    )
-    
+    traces.append(Scatter(
+        **xy(df_comp, 'unit_friction_kPa', depth_comp),
+        name='Compression',
+        line=dict(color='#0052CC', width=2),
+        mode='lines',
+    ))
+    cols.append(1)
+
     if df_tens is not None:
-        fig.add_trace(
-            go.Scatter(
-                x=df_tens['unit_friction_kPa'],
-                y=df_tens['depth_m'],
-                name='Tension',
-                line=dict(color='#6B5BFF', width=2, dash='dash'),
-                mode='lines',
-            ),
-            row=1, col=1
-        )
+        traces.append(Scatter(
+            **xy(df_tens, 'unit_friction_kPa', depth_tens),
+            name='Tension',
+            line=dict(color='#6B5BFF', width=2, dash='dash'),
+            mode='lines',
+        ))
+        cols.append(1)
 
     # Panel 2: End Bearing
-    fig.add_trace(
-        go.Scatter(
-            x=df_comp['end_bearing_kPa'],
-            y=df_comp['depth_m'],
-            name='End Bearing',
-            line=dict(color='#10b981', width=2),
-            mode='lines',
-            fill='tozerox',
-            fillcolor='rgba(16, 185, 129, 0.1)',
-        ),
-        row=1, col=2
-    )
+    traces.append(Scatter(
+        **xy(df_comp, 'end_bearing_kPa', depth_comp),
+        name='End Bearing',
+        line=dict(color='#10b981', width=2),
+        mode='lines',
+        fill='tozerox',
+        fillcolor='rgba(16, 185, 129, 0.1)',
+    ))
+    cols.append(2)
 
     # Panel 3: Total Capacity
-    fig.add_trace(
-        go.Scatter(
-            x=df_comp['total_capacity_kN'],
-            y=df_comp['depth_m'],
-            name='Compression',
-            line=dict(color='#0052CC', width=3),
-            mode='lines',
-        ),
-        row=1, col=3
-    )
-    
+    traces.append(Scatter(
+        **xy(df_comp, 'total_capacity_kN', depth_comp),
+        name='Compression',
+        line=dict(color='#0052CC', width=3),
+        mode='lines',
+    ))
+    cols.append(3)
+
     if df_tens is not None:
-        fig.add_trace(
-            go.Scatter(
-                x=df_tens['total_capacity_kN'],
-                y=df_tens['depth_m'],
-                name='Tension',
-                line=dict(color='#6B5BFF', width=3, dash='dash'),
-                mode='lines',
-            ),
-            row=1, col=3
-        )
+        traces.append(Scatter(
+            **xy(df_tens, 'total_capacity_kN', depth_tens),
+            name='Tension',
+            line=dict(color='#6B5BFF', width=3, dash='dash'),
+            mode='lines',
+        ))
+        cols.append(3)
+
+    fig.add_traces(traces, rows=[1] * len(traces), cols=cols)
 
     # Update axes
     fig.update_xaxes(title_text="Unit Friction (kPa)", row=1, col=1)
@@ -778,6 +918,67 @@ def create_capacity_plots(results: Dict, config: Dict):
     return fig
 
 
+def _curve_traces(table: pd.DataFrame, z_prefix: str, r_prefix: str, **trace_kwargs) -> list:
+    """One trace per depth of a wide t-z/Q-z table (z1..z8 in mm, r1..r8 in MN or MN/m)."""
+    z_vals = table[[f'{z_prefix}{i}' for i in range(1, 9)]].to_numpy(dtype=float) / 1000  # mm to m
+    r_vals = table[[f'{r_prefix}{i}' for i in range(1, 9)]].to_numpy(dtype=float) * 1000  # MN to kN
+    Scatter = _scatter_cls(z_vals.size)
+    return [
+        Scatter(x=z_row, y=r_row, name=f"{depth:.1f}m", mode='lines+markers', **trace_kwargs)
+        for depth, z_row, r_row in zip(table['Depth'].tolist(), z_vals, r_vals)
+    ]
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def create_curve_plot(table: pd.DataFrame, r_prefix: str, yaxis_title: str,
+                      heavy: bool = False) -> go.Figure:
+    """t-z or Q-z curve figure (shared across reruns for an unchanged table)."""
+    # z: mm to m, t/q: MN(/m) to kN(/m) - 8 points per curve
+    trace_kwargs = dict(line=dict(width=2), marker=dict(size=6)) if heavy else {}
+    fig = go.Figure(data=_curve_traces(table, 'z', r_prefix, **trace_kwargs))
+
+    fig.update_layout(
+        xaxis_title="Displacement (m)",
+        yaxis_title=yaxis_title,
+        height=400,
+        template='plotly_white'
+    )
+    # Add gridlines
+    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray',
+                     showline=True, linewidth=2, linecolor='black')
+    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='lightgray',
+                     showline=True, linewidth=2, linecolor='black')
+    return fig
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def create_py_plot(py_table: pd.DataFrame):
+    """Build the p-y curve figure (shared across reruns for an unchanged table)."""
+    # Plot all depths (reshape from wide format) - 5 points per curve
+    y_vals = py_table[[f'y{i}' for i in range(1, 6)]].to_numpy(dtype=float) / 1000  # mm to m
+    p_vals = py_table[[f'p{i}' for i in range(1, 6)]].to_numpy(dtype=float)
+
+    Scatter = _scatter_cls(y_vals.size)
+    fig_py = go.Figure(data=[
+        Scatter(x=y_row, y=p_row, name=f"{depth:.1f}m", mode='lines+markers')
+        for depth, y_row, p_row in zip(py_table['Depth'].tolist(), y_vals, p_vals)
+    ])
+
+    fig_py.update_layout(
+        xaxis_title="Lateral Displacement y (m)",
+        yaxis_title="Lateral Resistance p (kN/m)",
+        height=500,
+        template='plotly_white'
+    )
+    # Add gridlines
+    fig_py.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray',
+                       showline=True, linewidth=2, linecolor='black')
+    fig_py.update_yaxes(showgrid=True, gridwidth=1, gridcolor='lightgray',
+                       showline=True, linewidth=2, linecolor='black')
+
+    return fig_py
+
+
 def format_table_display(df: pd.DataFrame, table_type: str = 'tz') -> pd.DataFrame:
     """Format dataframe for display with proper decimal places."""
     if df.empty:
@@ -813,52 +1014,387 @@ def format_table_display(df: pd.DataFrame, table_type: str = 'tz') -> pd.DataFra
     return df.style.format(format_dict)
 
 
+def _pile_key(pile: PileProperties) -> tuple:
+    """Hashable cache key for pile properties."""
+    return (pile.diameter_m, pile.wall_thickness_m, pile.length_m,
+            pile.material, pile.pile_type.value)
+
+
+def _profile_key(profile: SoilProfile) -> tuple:
+    """Hashable cache key for a soil profile."""
+    return (
+        profile.site_name,
+        profile.water_depth_m,
+        profile.seafloor_elevation_m,
+        tuple(
+            (layer.name, layer.soil_type.value, layer.depth_top_m, layer.depth_bot_m,
+             _points_digest(layer.gamma_prime_kNm3), _points_digest(layer.su_kPa),
+             _points_digest(layer.phi_prime_deg), _points_digest(layer.E50_kPa),
+             _points_digest(layer.k_kNm3), _points_digest(layer.epsilon_50_pct),
+             layer.relative_density_pct, layer.is_cemented, layer.carbonate_content_pct,
+             layer.OCR, layer.PI)
+            for layer in profile.layers
+        ),
+    )
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _get_analysis(pile_key: tuple, profile_key: tuple,
+                  _pile: PileProperties, _profile: SoilProfile) -> PileDesignAnalysis:
+    """Analysis engine shared across reruns for the same pile and profile."""
+    return PileDesignAnalysis(_profile, _pile)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _axial_results(pile_key: tuple, profile_key: tuple, max_depth: float, dz: float,
+                   use_lrfd: bool, _pile: PileProperties, _profile: SoilProfile) -> Dict:
+    """Capacity profiles, cached independently of the table settings."""
+    analysis = _get_analysis(pile_key, profile_key, _pile, _profile)
+    return analysis.capacity_profiles(max_depth, dz, use_lrfd)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _load_displacement_results(pile_key: tuple, profile_key: tuple, max_depth: float,
+                               depth_interval: float, tz_depths,
+                               _pile: PileProperties, _profile: SoilProfile) -> Dict:
+    """t-z and Q-z tables, cached independently of the capacity and p-y settings."""
+    analysis = _get_analysis(pile_key, profile_key, _pile, _profile)
+    default_depths = analysis.default_table_depths(max_depth, depth_interval)
+    return analysis.load_displacement_tables(
+        tz_depths if tz_depths is not None else default_depths,
+        analysis.default_qz_depths(default_depths, max_depth),
+    )
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _lateral_results(pile_key: tuple, profile_key: tuple, max_depth: float,
+                     depth_interval: float, py_depths, analysis_type: str,
+                     _pile: PileProperties, _profile: SoilProfile) -> Dict:
+    """p-y table, cached independently of the axial settings."""
+    analysis = _get_analysis(pile_key, profile_key, _pile, _profile)
+    if py_depths is None:
+        py_depths = analysis.default_table_depths(max_depth, depth_interval)
+    return analysis.lateral_tables(py_depths, AnalysisType(analysis_type))
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _tip_result(pile_key: tuple, profile_key: tuple, depth_m: float,
+                _pile: PileProperties, _profile: SoilProfile) -> Dict:
+    """Layered compression capacity at one pile tip depth."""
+    return AxialCapacity.total_capacity_layered(_profile, _pile, depth_m, LoadingType.COMPRESSION)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _contributions_df(pile_key: tuple, profile_key: tuple, depth_m: float,
+                      _pile: PileProperties, _profile: SoilProfile) -> pd.DataFrame:
+    """Shaft friction share of each layer at one pile tip depth."""
+    contributions = _tip_result(pile_key, profile_key, depth_m, _pile, _profile)['layer_contributions']
+    friction = np.array([c['friction_kN'] for c in contributions], dtype=float)
+    return pd.DataFrame({
+        'Layer': [c['layer'] for c in contributions],
+        'Friction (kN)': friction,
+        'Contribution (%)': (friction / friction.sum() * 100).round(1),
+    })
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _validation_df(profile_key: tuple, _profile: SoilProfile) -> pd.DataFrame:
+    """Per-layer API Table 1 check shown in the Validation view."""
+    validation_data = []
+    for layer in _profile.layers:
+        # Check if parameters are from API Table 1
+        if layer.soil_type in SAND_SOIL_TYPES:
+            params = API_TABLE_1_EXTENDED.get(
+                (layer.get_relative_density_class().value, layer.soil_type.value))
+            if params is not None and params["beta"] is not None:
+                status = "✅ API Table 1"
+                details = f"β={params['beta']:.2f}, Nq={params['Nq']}"
+            else:
+                status = "⚠️ Not in Table 1"
+                details = "Using conservative estimate"
+        else:
+            status = "✅ Clay (α-method)"
+            details = "API Eq. 17-18"
+
+        validation_data.append({
+            'Layer': layer.name,
+            'Type': layer.soil_type.value,
+            'Status': status,
+            'Method': details
+        })
+    return pd.DataFrame(validation_data)
+
+
+def _run_analysis(pile_key: tuple, profile_key: tuple, max_depth: float, dz: float,
+                  depth_interval: float, tz_depths, py_depths, analysis_type: str,
+                  use_lrfd: bool, _pile: PileProperties, _profile: SoilProfile) -> Dict:
+    """Assemble run_complete_analysis() results from the per-stage caches."""
+    results = _axial_results(pile_key, profile_key, max_depth, dz, use_lrfd,
+                             _pile, _profile)
+    results.update(_load_displacement_results(pile_key, profile_key, max_depth,
+                                              depth_interval, tz_depths, _pile, _profile))
+    results.update(_lateral_results(pile_key, profile_key, max_depth, depth_interval,
+                                    py_depths, analysis_type, _pile, _profile))
+    return results
+
+
+# Capacity profiles longer than this are previewed as an LTTB subset
+PREVIEW_MAX_ROWS = 500
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Row indices kept by Largest-Triangle-Three-Buckets downsampling."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Interior points split into n_out - 2 buckets; first and last are always kept
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(int) + 1
+    edges[-1] = n - 1
+    idx = np.empty(n_out, dtype=int)
+    idx[0], idx[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket (the last point for the final bucket)
+        if i < n_out - 3:
+            x_c = x[hi:edges[i + 2]].mean()
+            y_c = y[hi:edges[i + 2]].mean()
+        else:
+            x_c, y_c = x[-1], y[-1]
+        area = np.abs((x[a] - x_c) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (y_c - y[a]))
+        a = lo + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
+
+
+def _preview_capacity_table(df: pd.DataFrame):
+    """Show a capacity profile, downsampled for display when it is long."""
+    if len(df) > PREVIEW_MAX_ROWS:
+        keep = _lttb_indices(df['depth_m'].to_numpy(dtype=float),
+                             df['total_capacity_kN'].to_numpy(dtype=float),
+                             PREVIEW_MAX_ROWS)
+        st.caption(f"Showing {PREVIEW_MAX_ROWS} of {len(df)} rows (LTTB on total capacity) - "
+                   "download the CSV for the full profile")
+        df = df.iloc[keep]
+    st.dataframe(df, use_container_width=True)
+
+
+def _preview_table(df: pd.DataFrame, key: str):
+    """Show the first PREVIEW_MAX_ROWS rows of a table unless all rows are requested."""
+    if len(df) > PREVIEW_MAX_ROWS and not st.checkbox(
+            f"Show all {len(df)} rows", key=f"preview_all_{key}"):
+        st.caption(f"Showing first {PREVIEW_MAX_ROWS} of {len(df)} rows - "
+                   "download the CSV for the full table")
+        df = df.head(PREVIEW_MAX_ROWS)
+    st.dataframe(df, use_container_width=True)
+
+
+@_fragment
+def _render_table_preview(results: Dict, config: Dict) -> None:
+    """Table preview picker; changing the selection reruns only this fragment."""
+    preview_table = st.selectbox(
+        "Select table to preview:",
+        ["Compression Capacity", "Tension Capacity", "t-z Compression", "Q-z", "p-y"]
+    )
+
+    if preview_table == "Compression Capacity":
+        _preview_capacity_table(results['capacity_compression_df'])
+    elif preview_table == "Tension Capacity" and 'Tension' in config['analysis_types']:
+        _preview_capacity_table(results['capacity_tension_df'])
+    elif preview_table == "t-z Compression":
+        _preview_table(results['tz_compression_table'], 'tz')
+    elif preview_table == "Q-z":
+        _preview_table(results['qz_table'], 'qz')
+    elif preview_table == "p-y" and 'Lateral' in config['analysis_types']:
+        _preview_table(results['py_table'], 'py')
+
+
+RESULT_VIEWS = [
+    "📊 Capacity Profiles",
+    "📈 Load-Displacement",
+    "📉 Lateral p-y",
+    "📋 Data Tables",
+    "🔍 Validation",
+    "📄 Report",
+]
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _csv_bytes(df: pd.DataFrame) -> bytes:
+    """CSV export of a results table, serialized once per distinct table."""
+    return df.to_csv(index=False).encode('utf-8')
+
+
+# Layer contributions beyond this count are drawn as bars instead of a pie
+PIE_MAX_SLICES = 20
+
+# Plotly config for summary figures that are read rather than explored:
+# no mode bar to build, hover and zoom still work
+SUMMARY_CHART_CONFIG = {'displayModeBar': False}
+
+
+def _peak_capacity(df: pd.DataFrame) -> Tuple[float, float]:
+    """Maximum total capacity and its depth, from a single argmax pass."""
+    capacity = df['total_capacity_kN'].to_numpy()
+    i_max = int(np.nanargmax(capacity))  # NaN-skipping, like Series.idxmax
+    return float(capacity[i_max]), float(df['depth_m'].to_numpy()[i_max])
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _report_markdown(pile_key: tuple, profile_key: tuple, config: Dict, analysis_time: str,
+                     compression: Tuple[float, float], tension, resistance_factor: float,
+                     penetration_status: str, _pile: PileProperties, _profile: SoilProfile) -> str:
+    """Design summary report as one markdown string (cached on its inputs)."""
+    pile, profile = _pile, _profile
+    max_cap_comp, depth_max_comp = compression
+
+    layers_md = "\n".join(
+        f"""
+**{i}. {layer.name}** ({layer.soil_type.value})
+- Depth: {layer.depth_top_m:.1f} - {layer.depth_bot_m:.1f} m
+- Relative Density: {layer.relative_density_pct:.0f}% ({layer.get_relative_density_class().value.replace('_', ' ')})
+- Carbonate Content: {layer.carbonate_content_pct:.0f}%
+- Cemented: {"Yes" if layer.is_cemented else "No"}
+"""
+        for i, layer in enumerate(profile.layers, 1)
+    )
+
+    tension_md = ""
+    if tension is not None:
+        max_cap_tens, depth_max_tens = tension
+        tension_md = f"""
+#### Tension
+- **Maximum Capacity:** {max_cap_tens:,.0f} kN
+- **At Depth:** {depth_max_tens:.1f} m
+"""
+
+    return f"""
+### PROJECT INFORMATION
+- **Project:** {config['project_name']}
+- **Designer:** {config['designer']}
+- **Date:** {analysis_time}
+- **Software:** pile-SRI v2.6
+
+---
+
+### PILE PROPERTIES
+- **Diameter:** {pile.diameter_m:.3f} m
+- **Wall Thickness:** {pile.wall_thickness_m:.4f} m
+- **Embedded Length:** {pile.length_m:.1f} m
+- **Type:** {pile.pile_type.value}
+- **Gross Area:** {pile.area_gross_m2:.4f} m²
+
+---
+
+### SOIL PROFILE
+- **Site:** {profile.site_name}
+- **Water Depth:** {profile.water_depth_m:.0f} m
+- **Number of Layers:** {len(profile.layers)}
+
+#### Layers:
+{layers_md}
+
+---
+
+### ANALYSIS PARAMETERS
+- **Design Method:** {"LRFD" if config['use_lrfd'] else f"ASD (SF={config['safety_factor']})"}
+- **Analysis Types:** {', '.join(config['analysis_types'])}
+- **Loading Condition:** {config['loading_condition']}
+- **Max Depth:** {config['max_depth']} m
+- **Depth Increment:** {config['depth_increment']} m
+
+---
+
+### CAPACITY RESULTS
+
+#### Compression
+- **Maximum Capacity:** {max_cap_comp:,.0f} kN
+- **At Depth:** {depth_max_comp:.1f} m
+- **Resistance Factor:** {resistance_factor:.2f}
+{tension_md}
+---
+
+### API RP 2GEO COMPLIANCE
+
+✅ **Section 8.1:** Axial capacity calculations (α-method for clay, API Table 1 for sand)
+
+✅ **Section 8.2:** Tension capacity (separate calculation, no end bearing)
+
+✅ **Section 8.4:** Load-displacement curves (t-z and Q-z, 5-point discretization)
+
+✅ **Section 8.5:** Lateral capacity (p-y curves per Matlock/Reese/API methods)
+
+✅ **Table 1:** Extended implementation for all soil types
+
+✅ **Annex A:** LRFD resistance factors
+
+✅ **Annex B:** Carbonate soil considerations
+
+✅ **Annex C:** Penetration requirements ({penetration_status})
+
+---
+
+### NOTES
+
+- Analysis performed using pile-SRI v2.6
+- Based on API RP 2GEO Section 8 (Geotechnical and Foundation Design Considerations)
+- Results should be reviewed by a qualified geotechnical engineer
+
+---
+
+**Copyright (c) 2025 Dr. Chitti S S U Srikanth. All rights reserved.**
+"""
+
+
 def render_results(config, pile, profile):
     """Render comprehensive v2.6.1 results."""
 
-    # Run analysis
-    analysis = PileDesignAnalysis(profile, pile)
-    
     try:
         analysis_type = AnalysisType.STATIC if config['loading_condition'] == 'Static' else AnalysisType.CYCLIC
-        
-        results = analysis.run_complete_analysis(
-            max_depth_m=config['max_depth'],
-            dz=config['depth_increment'],
-            depth_interval=config['depth_interval'],  # NEW in v2.6.1
-            tz_depths=config['tz_depths'],
-            py_depths=config['py_depths'],
-            analysis_type=analysis_type,
-            use_lrfd=config['use_lrfd']
+
+        # Cache keys for this pile/profile, computed once per rerun
+        pile_key, profile_key = _pile_key(pile), _profile_key(profile)
+
+        # Run analysis (cached across reruns while inputs are unchanged)
+        results = _run_analysis(
+            pile_key, profile_key,
+            config['max_depth'], config['depth_increment'], config['depth_interval'],
+            config['tz_depths'], config['py_depths'], analysis_type.value, config['use_lrfd'],
+            _pile=pile, _profile=profile,
         )
 
         # Dictionary to store plot figures for PDF export
         plot_figs = {}
 
-        # Create tabs
-        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-            "📊 Capacity Profiles",
-            "📈 Load-Displacement",
-            "📉 Lateral p-y",
-            "📋 Data Tables",
-            "🔍 Validation",
-            "📄 Report"
-        ])
-
-        # TAB 1: Capacity Profiles
-        with tab1:
+        # Peak capacities (shown in the capacity view and the report)
+        df_comp = results['capacity_compression_df']
+        max_cap_comp, depth_max_comp = _peak_capacity(df_comp)
+        # The tip result is taken at the peak depth. When that is exactly the max
+        # depth, pass config['max_depth'] itself so the capacity, validation and
+        # report views share one cached tip result
+        tip_depth = (config['max_depth'] if depth_max_comp == config['max_depth']
+                     else depth_max_comp)
+        if 'Tension' in config['analysis_types']:
+            df_tens = results['capacity_tension_df']
+            max_cap_tens, depth_max_tens = _peak_capacity(df_tens)
+
+        # Only the selected view is built on each rerun (st.tabs would build all six)
+        view = st.radio("View", RESULT_VIEWS, horizontal=True, key="results_view",
+                        label_visibility="collapsed")
+
+        # VIEW 1: Capacity Profiles
+        if view == RESULT_VIEWS[0]:
             st.subheader("Axial Capacity Profiles")
 
             # 3-panel plot
-            fig_cap = create_capacity_plots(results, config)
+            fig_cap = create_capacity_plots(
+                df_comp, df_tens if 'Tension' in config['analysis_types'] else None)
             plot_figs['capacity'] = fig_cap  # Store for PDF export
-            st.plotly_chart(fig_cap, use_container_width=True)
+            st.plotly_chart(fig_cap, use_container_width=True, config=SUMMARY_CHART_CONFIG)
             
             # Metrics
-            df_comp = results['capacity_compression_df']
-            max_cap_comp = df_comp['total_capacity_kN'].max()
-            depth_max_comp = df_comp.loc[df_comp['total_capacity_kN'].idxmax(), 'depth_m']
-            
             col1, col2, col3, col4 = st.columns(4)
             with col1:
                 st.metric("Max Compression Capacity", f"{max_cap_comp:,.0f} kN")
@@ -866,10 +1402,6 @@ def render_results(config, pile, profile):
                 st.metric("At Depth", f"{depth_max_comp:.1f} m")
             
             if 'Tension' in config['analysis_types']:
-                df_tens = results['capacity_tension_df']
-                max_cap_tens = df_tens['total_capacity_kN'].max()
-                depth_max_tens = df_tens.loc[df_tens['total_capacity_kN'].idxmax(), 'depth_m']
-                
                 with col3:
                     st.metric("Max Tension Capacity", f"{max_cap_tens:,.0f} kN")
                 with col4:
@@ -880,27 +1412,33 @@ def render_results(config, pile, profile):
             st.markdown("### 🔍 Layer-by-Layer Breakdown")
             
             # Get detailed result at max depth
-            tip_result = AxialCapacity.total_capacity_layered(
-                profile, pile, depth_max_comp, LoadingType.COMPRESSION
-            )
+            tip_result = _tip_result(pile_key, profile_key, tip_depth,
+                                     _pile=pile, _profile=profile)
             
             if tip_result['layer_contributions']:
-                contrib_df = pd.DataFrame(tip_result['layer_contributions'])
-                contrib_df['Percentage'] = (contrib_df['friction_kN'] / contrib_df['friction_kN'].sum() * 100).round(1)
-                contrib_df.columns = ['Layer', 'Friction (kN)', 'Contribution (%)']
-                
+                contrib_df = _contributions_df(pile_key, profile_key, tip_depth,
+                                               _pile=pile, _profile=profile)
+
                 col1, col2 = st.columns([2, 1])
                 with col1:
                     st.dataframe(contrib_df, use_container_width=True, hide_index=True)
                 
                 with col2:
-                    fig_pie = go.Figure(data=[go.Pie(
-                        labels=contrib_df['Layer'],
-                        values=contrib_df['Friction (kN)'],
-                        hole=0.3
-                    )])
-                    fig_pie.update_layout(height=300, margin=dict(t=30, b=0, l=0, r=0))
-                    st.plotly_chart(fig_pie, use_container_width=True)
+                    # Pies get hard to read and slow to draw with many slices
+                    if len(contrib_df) <= PIE_MAX_SLICES:
+                        fig_contrib = go.Figure(data=[go.Pie(
+                            labels=contrib_df['Layer'],
+                            values=contrib_df['Friction (kN)'],
+                            hole=0.3
+                        )])
+                    else:
+                        fig_contrib = go.Figure(data=[go.Bar(
+                            x=contrib_df['Contribution (%)'],
+                            y=contrib_df['Layer'],
+                            orientation='h'
+                        )])
+                    fig_contrib.update_layout(height=300, margin=dict(t=30, b=0, l=0, r=0))
+                    st.plotly_chart(fig_contrib, use_container_width=True, config=SUMMARY_CHART_CONFIG)
             
             # Penetration status
             st.markdown("---")
@@ -916,8 +1454,8 @@ def render_results(config, pile, profile):
             else:
                 st.warning(f"⚠️ {status}")
 
-        # TAB 2: Load-Displacement (t-z and Q-z)
-        with tab2:
+        # VIEW 2: Load-Displacement (t-z and Q-z)
+        if view == RESULT_VIEWS[1]:
             st.subheader("Load-Displacement Curves")
             
             col1, col2 = st.columns(2)
@@ -928,40 +1466,14 @@ def render_results(config, pile, profile):
                 
                 tz_comp = results['tz_compression_table']
                 if not tz_comp.empty and 'Soil type' in tz_comp.columns:
-                    # Plot (reshape from wide format) - show compression only
-                    fig_tz = go.Figure()
-
                     # v2.6.1: Display compression and tension in separate tabs
                     tab_comp, tab_tens = st.tabs(["Compression", "Tension"])
 
+                    # The engine already splits the t-z table by 'Soil type' (c/t)
                     with tab_comp:
-                        compression_rows = tz_comp[tz_comp['Soil type'] == 'c']
+                        compression_rows = tz_comp
                         if not compression_rows.empty:
-                            fig_tz_comp = go.Figure()
-                            for _, row in compression_rows.iterrows():
-                                depth = row['Depth']
-                                # Extract z and t values from wide format - 8 points now
-                                z_vals = [row[f'z{i}']/1000 for i in range(1, 9)]  # mm to m (8 points)
-                                t_vals = [row[f't{i}']*1000 for i in range(1, 9)]  # MN/m to kN/m (8 points)
-
-                                fig_tz_comp.add_trace(go.Scatter(
-                                    x=z_vals,
-                                    y=t_vals,
-                                    name=f"{depth:.1f}m",
-                                    mode='lines+markers',
-                                ))
-
-                            fig_tz_comp.update_layout(
-                                xaxis_title="Displacement (m)",
-                                yaxis_title="Unit Friction (kN/m)",
-                                height=400,
-                                template='plotly_white'
-                            )
-                            # Add gridlines
-                            fig_tz_comp.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray',
-                                                    showline=True, linewidth=2, linecolor='black')
-                            fig_tz_comp.update_yaxes(showgrid=True, gridwidth=1, gridcolor='lightgray',
-                                                    showline=True, linewidth=2, linecolor='black')
+                            fig_tz_comp = create_curve_plot(compression_rows, 't', "Unit Friction (kN/m)")
                             plot_figs['tz_compression'] = fig_tz_comp  # Store for PDF export
                             st.plotly_chart(fig_tz_comp, use_container_width=True)
 
@@ -973,34 +1485,9 @@ def render_results(config, pile, profile):
                             st.info("No compression t-z data available.")
 
                     with tab_tens:
-                        tz_tens = results['tz_tension_table']
-                        tension_rows = tz_tens[tz_tens['Soil type'] == 't']
+                        tension_rows = results['tz_tension_table']
                         if not tension_rows.empty:
-                            fig_tz_tens = go.Figure()
-                            for _, row in tension_rows.iterrows():
-                                depth = row['Depth']
-                                # Extract z and t values from wide format - 8 points now
-                                z_vals = [row[f'z{i}']/1000 for i in range(1, 9)]  # mm to m (8 points)
-                                t_vals = [row[f't{i}']*1000 for i in range(1, 9)]  # MN/m to kN/m (8 points)
-
-                                fig_tz_tens.add_trace(go.Scatter(
-                                    x=z_vals,
-                                    y=t_vals,
-                                    name=f"{depth:.1f}m",
-                                    mode='lines+markers',
-                                ))
-
-                            fig_tz_tens.update_layout(
-                                xaxis_title="Displacement (m)",
-                                yaxis_title="Unit Friction (kN/m)",
-                                height=400,
-                                template='plotly_white'
-                            )
-                            # Add gridlines
-                            fig_tz_tens.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray',
-                                                    showline=True, linewidth=2, linecolor='black')
-                            fig_tz_tens.update_yaxes(showgrid=True, gridwidth=1, gridcolor='lightgray',
-                                                    showline=True, linewidth=2, linecolor='black')
+                            fig_tz_tens = create_curve_plot(tension_rows, 't', "Unit Friction (kN/m)")
                             plot_figs['tz_tension'] = fig_tz_tens  # Store for PDF export
                             st.plotly_chart(fig_tz_tens, use_container_width=True)
 
@@ -1019,36 +1506,8 @@ def render_results(config, pile, profile):
                 
                 qz = results['qz_table']
                 if not qz.empty and 'q1' in qz.columns:
-                    # Plot (reshape from wide format)
-                    fig_qz = go.Figure()
-
-                    # Plot all depths in Q-z table
-                    for _, row in qz.iterrows():
-                        depth = row['Depth']
-                        # Extract z and q values from wide format - 8 points now
-                        z_vals = [row[f'z{i}']/1000 for i in range(1, 9)]  # mm to m (8 points)
-                        q_vals = [row[f'q{i}']*1000 for i in range(1, 9)]  # MN to kN (8 points)
-
-                        fig_qz.add_trace(go.Scatter(
-                            x=z_vals,
-                            y=q_vals,
-                            name=f"{depth:.1f}m",
-                            mode='lines+markers',
-                            line=dict(width=2),
-                            marker=dict(size=6),
-                        ))
-
-                    fig_qz.update_layout(
-                        xaxis_title="Displacement (m)",
-                        yaxis_title="End Bearing (kN)",
-                        height=400,
-                        template='plotly_white'
-                    )
-                    # Add gridlines
-                    fig_qz.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray',
-                                       showline=True, linewidth=2, linecolor='black')
-                    fig_qz.update_yaxes(showgrid=True, gridwidth=1, gridcolor='lightgray',
-                                       showline=True, linewidth=2, linecolor='black')
+                    # Plot all depths in the Q-z table
+                    fig_qz = create_curve_plot(qz, 'q', "End Bearing (kN)", heavy=True)
                     plot_figs['qz'] = fig_qz  # Store for PDF export
                     st.plotly_chart(fig_qz, use_container_width=True)
 
@@ -1067,40 +1526,14 @@ def render_results(config, pile, profile):
                               "- No soil layer exists at pile tip depth\n\n"
                               "👉 Check your **soil profile** extends to pile tip depth.")
 
-        # TAB 3: Lateral p-y curves
-        with tab3:
+        # VIEW 3: Lateral p-y curves
+        if view == RESULT_VIEWS[2]:
             if 'Lateral' in config['analysis_types']:
                 st.subheader("Lateral p-y Curves")
                 
                 py_table = results['py_table']
                 if not py_table.empty and 'p1' in py_table.columns and 'Depth' in py_table.columns:
-                    # Plot all depths (reshape from wide format)
-                    fig_py = go.Figure()
-
-                    for _, row in py_table.iterrows():
-                        depth = row['Depth']
-                        # Extract y and p values from wide format - 5 points
-                        y_vals = [row[f'y{i}']/1000 for i in range(1, 6)]  # mm to m (5 points)
-                        p_vals = [row[f'p{i}'] for i in range(1, 6)]  # 5 points
-
-                        fig_py.add_trace(go.Scatter(
-                            x=y_vals,
-                            y=p_vals,
-                            name=f"{depth:.1f}m",
-                            mode='lines+markers',
-                        ))
-
-                    fig_py.update_layout(
-                        xaxis_title="Lateral Displacement y (m)",
-                        yaxis_title="Lateral Resistance p (kN/m)",
-                        height=500,
-                        template='plotly_white'
-                    )
-                    # Add gridlines
-                    fig_py.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray',
-                                       showline=True, linewidth=2, linecolor='black')
-                    fig_py.update_yaxes(showgrid=True, gridwidth=1, gridcolor='lightgray',
-                                       showline=True, linewidth=2, linecolor='black')
+                    fig_py = create_py_plot(py_table)
                     plot_figs['py'] = fig_py  # Store for PDF export
                     st.plotly_chart(fig_py, use_container_width=True)
 
@@ -1115,8 +1548,8 @@ def render_results(config, pile, profile):
             else:
                 st.info("Lateral analysis not selected. Enable in sidebar.")
 
-        # TAB 4: Data Tables (Export)
-        with tab4:
+        # VIEW 4: Data Tables (Export)
+        if view == RESULT_VIEWS[3]:
             st.subheader("📥 Export Data Tables")
             
             col1, col2 = st.columns(2)
@@ -1125,7 +1558,7 @@ def render_results(config, pile, profile):
                 st.markdown("#### Capacity Profiles")
                 
                 # Compression
-                csv_comp = results['capacity_compression_df'].to_csv(index=False)
+                csv_comp = _csv_bytes(results['capacity_compression_df'])
                 st.download_button(
                     "📥 Download Compression Capacity",
                     csv_comp,
@@ -1136,7 +1569,7 @@ def render_results(config, pile, profile):
                 
                 # Tension
                 if 'Tension' in config['analysis_types']:
-                    csv_tens = results['capacity_tension_df'].to_csv(index=False)
+                    csv_tens = _csv_bytes(results['capacity_tension_df'])
                     st.download_button(
                         "📥 Download Tension Capacity",
                         csv_tens,
@@ -1149,7 +1582,7 @@ def render_results(config, pile, profile):
                 st.markdown("#### Load-Displacement")
                 
                 # t-z
-                csv_tz = results['tz_compression_table'].to_csv(index=False)
+                csv_tz = _csv_bytes(results['tz_compression_table'])
                 st.download_button(
                     "📥 Download t-z Table",
                     csv_tz,
@@ -1159,7 +1592,7 @@ def render_results(config, pile, profile):
                 )
                 
                 # Q-z
-                csv_qz = results['qz_table'].to_csv(index=False)
+                csv_qz = _csv_bytes(results['qz_table'])
                 st.download_button(
                     "📥 Download Q-z Table",
                     csv_qz,
@@ -1170,7 +1603,7 @@ def render_results(config, pile, profile):
                 
                 # p-y
                 if 'Lateral' in config['analysis_types']:
-                    csv_py = results['py_table'].to_csv(index=False)
+                    csv_py = _csv_bytes(results['py_table'])
                     st.download_button(
                         "📥 Download p-y Table",
                         csv_py,
@@ -1190,7 +1623,7 @@ def render_results(config, pile, profile):
                     st.dataframe(design_params_df, use_container_width=True, hide_index=True)
 
                     # Download button for design parameters
-                    csv_design = design_params_df.to_csv(index=False)
+                    csv_design = _csv_bytes(design_params_df)
                     st.download_button(
                         "📥 Download Design Soil Parameters",
                         csv_design,
@@ -1217,25 +1650,10 @@ def render_results(config, pile, profile):
             # Preview tables
             st.markdown("---")
             st.markdown("### 👁️ Preview Tables")
-            
-            preview_table = st.selectbox(
-                "Select table to preview:",
-                ["Compression Capacity", "Tension Capacity", "t-z Compression", "Q-z", "p-y"]
-            )
-            
-            if preview_table == "Compression Capacity":
-                st.dataframe(results['capacity_compression_df'], use_container_width=True)
-            elif preview_table == "Tension Capacity" and 'Tension' in config['analysis_types']:
-                st.dataframe(results['capacity_tension_df'], use_container_width=True)
-            elif preview_table == "t-z Compression":
-                st.dataframe(results['tz_compression_table'], use_container_width=True)
-            elif preview_table == "Q-z":
-                st.dataframe(results['qz_table'], use_container_width=True)
-            elif preview_table == "p-y" and 'Lateral' in config['analysis_types']:
-                st.dataframe(results['py_table'], use_container_width=True)
-
-        # TAB 5: Validation
-        with tab5:
+            _render_table_preview(results, config)
+
+        # VIEW 5: Validation
+        if view == RESULT_VIEWS[4]:
             st.subheader("✅ API RP 2GEO Compliance Validation")
 
             # Design method
@@ -1250,41 +1668,15 @@ def render_results(config, pile, profile):
             st.markdown("---")
             st.markdown("### Soil Parameters Validation")
             
-            validation_data = []
-            for layer in profile.layers:
-                # Check if parameters are from API Table 1
-                if layer.soil_type in [SoilType.SAND, SoilType.SAND_SILT]:
-                    dr_class = layer.get_relative_density_class().value
-                    soil_desc = layer.soil_type.value
-                    key = (dr_class, soil_desc)
-                    
-                    if key in API_TABLE_1_EXTENDED and API_TABLE_1_EXTENDED[key]["beta"] is not None:
-                        params = API_TABLE_1_EXTENDED[key]
-                        status = "✅ API Table 1"
-                        details = f"β={params['beta']:.2f}, Nq={params['Nq']}"
-                    else:
-                        status = "⚠️ Not in Table 1"
-                        details = "Using conservative estimate"
-                else:
-                    status = "✅ Clay (α-method)"
-                    details = "API Eq. 17-18"
-                
-                validation_data.append({
-                    'Layer': layer.name,
-                    'Type': layer.soil_type.value,
-                    'Status': status,
-                    'Method': details
-                })
-            
-            st.dataframe(pd.DataFrame(validation_data), use_container_width=True, hide_index=True)
+            st.dataframe(_validation_df(profile_key, _profile=profile),
+                         use_container_width=True, hide_index=True)
             
             # Penetration requirements
             st.markdown("---")
             st.markdown("### Penetration Requirements")
             
-            tip_result = AxialCapacity.total_capacity_layered(
-                profile, pile, config['max_depth'], LoadingType.COMPRESSION
-            )
+            tip_result = _tip_result(pile_key, profile_key, config['max_depth'],
+                                     _pile=pile, _profile=profile)
             
             st.write(f"**Pile Diameter:** {pile.diameter_m:.2f} m")
             st.write(f"**Required Penetration:** {2*pile.diameter_m:.2f} m (minimum), {3*pile.diameter_m:.2f} m (recommended)")
@@ -1308,125 +1700,64 @@ def render_results(config, pile, profile):
             if not has_carbonate and not has_cemented:
                 st.success("✅ Standard siliceous soils")
 
-        # TAB 6: Report
-        with tab6:
+        # VIEW 6: Report
+        if view == RESULT_VIEWS[5]:
             st.subheader("📄 Design Summary Report")
 
             st.info("💡 **Tip:** Use the download buttons in other tabs to export plots (PNG) and tables (CSV)")
 
             st.markdown("---")
 
-            st.markdown(f"""
-            ### PROJECT INFORMATION
-            - **Project:** {config['project_name']}
-            - **Designer:** {config['designer']}
-            - **Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-            - **Software:** pile-SRI v2.6
-            
-            ---
-            
-            ### PILE PROPERTIES
-            - **Diameter:** {pile.diameter_m:.3f} m
-            - **Wall Thickness:** {pile.wall_thickness_m:.4f} m
-            - **Embedded Length:** {pile.length_m:.1f} m
-            - **Type:** {pile.pile_type.value}
-            - **Gross Area:** {pile.area_gross_m2:.4f} m²
-            
-            ---
-            
-            ### SOIL PROFILE
-            - **Site:** {profile.site_name}
-            - **Water Depth:** {profile.water_depth_m:.0f} m
-            - **Number of Layers:** {len(profile.layers)}
-            
-            #### Layers:
-            """)
-            
-            for i, layer in enumerate(profile.layers, 1):
-                st.markdown(f"""
-            **{i}. {layer.name}** ({layer.soil_type.value})
-            - Depth: {layer.depth_top_m:.1f} - {layer.depth_bot_m:.1f} m
-            - Relative Density: {layer.relative_density_pct:.0f}% ({layer.get_relative_density_class().value.replace('_', ' ')})
-            - Carbonate Content: {layer.carbonate_content_pct:.0f}%
-            - Cemented: {"Yes" if layer.is_cemented else "No"}
-                """)
-            
-            st.markdown(f"""
-            ---
-            
-            ### ANALYSIS PARAMETERS
-            - **Design Method:** {"LRFD" if config['use_lrfd'] else f"ASD (SF={config['safety_factor']})"}
-            - **Analysis Types:** {', '.join(config['analysis_types'])}
-            - **Loading Condition:** {config['loading_condition']}
-            - **Max Depth:** {config['max_depth']} m
-            - **Depth Increment:** {config['depth_increment']} m
-            
-            ---
-            
-            ### CAPACITY RESULTS
-            
-            #### Compression
-            - **Maximum Capacity:** {max_cap_comp:,.0f} kN
-            - **At Depth:** {depth_max_comp:.1f} m
-            - **Resistance Factor:** {tip_result['applied_resistance_factor']:.2f}
-            """)
-            
-            if 'Tension' in config['analysis_types']:
-                st.markdown(f"""
-            #### Tension
-            - **Maximum Capacity:** {max_cap_tens:,.0f} kN
-            - **At Depth:** {depth_max_tens:.1f} m
-                """)
-            
-            st.markdown(f"""
-            ---
-            
-            ### API RP 2GEO COMPLIANCE
-            
-            ✅ **Section 8.1:** Axial capacity calculations (α-method for clay, API Table 1 for sand)
-            
-            ✅ **Section 8.2:** Tension capacity (separate calculation, no end bearing)
-            
-            ✅ **Section 8.4:** Load-displacement curves (t-z and Q-z, 5-point discretization)
-            
-            ✅ **Section 8.5:** Lateral capacity (p-y curves per Matlock/Reese/API methods)
-            
-            ✅ **Table 1:** Extended implementation for all soil types
-            
-            ✅ **Annex A:** LRFD resistance factors
-            
-            ✅ **Annex B:** Carbonate soil considerations
-            
-            ✅ **Annex C:** Penetration requirements ({tip_result['penetration_status']})
-
-            ---
-
-            ### NOTES
-
-            - Analysis performed using pile-SRI v2.6
-            - Based on API RP 2GEO Section 8 (Geotechnical and Foundation Design Considerations)
-            - Results should be reviewed by a qualified geotechnical engineer
-            
-            ---
-            
-            **Copyright (c) 2025 Dr. Chitti S S U Srikanth. All rights reserved.**
-            """)
+            # Penetration check at the analysis depth (as in the Validation view)
+            tip_result = _tip_result(pile_key, profile_key, config['max_depth'],
+                                     _pile=pile, _profile=profile)
+            tension = (max_cap_tens, depth_max_tens) if 'Tension' in config['analysis_types'] else None
+            st.markdown(_report_markdown(
+                pile_key, profile_key, config,
+                st.session_state.get('analysis_time', datetime.now()).strftime('%Y-%m-%d %H:%M:%S'),
+                (max_cap_comp, depth_max_comp), tension,
+                tip_result['applied_resistance_factor'], tip_result['penetration_status'],
+                _pile=pile, _profile=profile,
+            ))
     
     except Exception as e:
+        logger.exception("Analysis failed")
         st.error(f"❌ Analysis error: {str(e)}")
-        st.exception(e)
+        with st.expander("Show traceback"):
+            st.code(traceback.format_exc())
 
 
 # ============================================================================
 # MAIN APPLICATION
 # ============================================================================
 
+@st.cache_data(max_entries=8, show_spinner=False)
+def _validate_layers(digest: tuple, _profile: SoilProfile) -> List[str]:
+    """Return the first missing-data error for the profile (empty if valid)."""
+    for i, layer in enumerate(_profile.layers):
+        if not layer.gamma_prime_kNm3:
+            return [f"⚠️ Layer {i+1} ({layer.name}) missing γ' data!"]
+
+        if layer.soil_type in CLAY_SOIL_TYPES and not layer.su_kPa:
+            return [f"⚠️ Layer {i+1} ({layer.name}) missing Su data!"]
+
+        if layer.soil_type in SAND_SOIL_TYPES and not layer.phi_prime_deg:
+            return [f"⚠️ Layer {i+1} ({layer.name}) missing φ' data!"]
+    return []
+
+
 def main():
     """Main application flow."""
-    
+
+    configure_page()
+
     if not CALC_ENGINE_AVAILABLE:
+        st.error("⚠️ calculations_v2_1.py not found! Please ensure it's in the same directory.")
         st.stop()
-    
+
+    if 'run_analysis' not in st.session_state:
+        st.session_state.run_analysis = False
+
     render_header()
     config = render_sidebar()
     
@@ -1447,22 +1778,14 @@ def main():
             st.error("⚠️ Please add at least one soil layer!")
             st.stop()
         
-        # Validate layers
-        for i, layer in enumerate(profile.layers):
-            if not layer.gamma_prime_kNm3:
-                st.error(f"⚠️ Layer {i+1} ({layer.name}) missing γ' data!")
-                st.stop()
-            
-            if layer.soil_type in [SoilType.CLAY, SoilType.SILT] and not layer.su_kPa:
-                st.error(f"⚠️ Layer {i+1} ({layer.name}) missing Su data!")
-                st.stop()
-            
-            if layer.soil_type in [SoilType.SAND, SoilType.SAND_SILT] and not layer.phi_prime_deg:
-                st.error(f"⚠️ Layer {i+1} ({layer.name}) missing φ' data!")
-                st.stop()
-        
+        # Validate layers (cached per soil input)
+        for message in _validate_layers(st.session_state['_soil_digest'], _profile=profile):
+            st.error(message)
+            st.stop()
+
         # Store in session
         st.session_state.run_analysis = True
+        st.session_state.analysis_time = datetime.now()
         st.session_state.config = config
         st.session_state.pile = pile
         st.session_state.profile = profile
@@ -1478,7 +1801,4 @@ def main():
 
 
 if __name__ == "__main__":
-    if 'run_analysis' not in st.session_state:
-        st.session_state.run_analysis = False
-    
     main()
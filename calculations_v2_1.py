@@ -26,15 +26,18 @@ Version: 2.6.1
 """
 
 from __future__ import annotations
+from bisect import insort
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict, Union
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 import numpy as np
 import pandas as pd
-from scipy import interpolate
 import warnings
 from datetime import datetime
 import io
+import threading
 
 # PDF generation imports (imported conditionally to avoid errors if not installed)
 try:
@@ -77,6 +80,19 @@ try:
 except ImportError:
     KALEIDO_AVAILABLE = False
 
+# Numba JIT for numerical kernels (optional - kernels run as plain Python without it)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 
 # ============================================================================
 # KALEIDO CONFIGURATION HELPER
@@ -155,6 +171,12 @@ class SoilType(Enum):
     ROCK = "rock"
 
 
+# Soil types designed with the clay (alpha, Matlock/Reese) and sand (beta,
+# API sand p-y) methods
+CLAY_SOIL_TYPES = (SoilType.CLAY, SoilType.SILT)
+SAND_SOIL_TYPES = (SoilType.SAND, SoilType.SAND_SILT)
+
+
 class PileType(Enum):
     """Pile type classification."""
     DRIVEN_PIPE_OPEN = "driven_pipe_open"
@@ -251,10 +273,71 @@ CARBONATE_REDUCTION_FACTORS = {
 }
 
 
+# p-y curve shapes (p/pu against y/y_c), shared by every depth
+MATLOCK_P_RATIOS = np.array([0.0, 0.23, 0.33, 0.50, 0.72, 1.00, 1.00])
+MATLOCK_Y_RATIOS = np.array([0.0, 0.1, 0.3, 1.0, 3.0, 8.0, np.inf])
+MATLOCK_CYCLIC_SHALLOW_P_RATIOS = np.array([0.0, 0.23, 0.33, 0.50, 0.72, 0.72])
+MATLOCK_CYCLIC_SHALLOW_Y_RATIOS = np.array([0.0, 0.1, 0.3, 1.0, 3.0, np.inf])
+# Reese y ratios are normalized to y_50 (displacement at 50% resistance)
+REESE_P_RATIOS = np.array([0.0, 0.25, 0.50, 0.75, 0.95, 0.95])
+REESE_Y_RATIOS = np.array([0.0, 0.3, 1.0, 3.0, 10.0, np.inf])
+REESE_CYCLIC_P_RATIOS = np.array([0.0, 0.25, 0.50, 0.50])
+REESE_CYCLIC_Y_RATIOS = np.array([0.0, 0.3, 1.0, np.inf])
+
+# t-z curve shapes (t/t_max against z/z_peak, API 8.4.2); clay loses strength
+# past the peak to a residual of TZ_CLAY_RESIDUAL_RATIO * t_max
+TZ_CLAY_Z_RATIOS = np.array([0.0, 0.16, 0.31, 0.57, 0.80, 1.00, 2.00, np.inf])
+TZ_CLAY_PEAK_T_RATIOS = np.array([0.0, 0.30, 0.50, 0.75, 0.90, 1.00])
+TZ_CLAY_RESIDUAL_RATIO = 0.8
+TZ_SAND_Z_RATIOS = np.array([0.0, 0.16, 0.31, 0.57, 0.80, 1.00, np.inf])
+TZ_SAND_T_RATIOS = np.array([0.0, 0.30, 0.50, 0.75, 0.90, 1.00, 1.00])
+# Q-z curve shape (Q/Q_p against z/D, API 8.4.3)
+QZ_Z_D_RATIOS = np.array([0.0, 0.002, 0.013, 0.042, 0.073, 0.100, np.inf])
+QZ_Q_RATIOS = np.array([0.0, 0.25, 0.50, 0.75, 0.90, 1.00, 1.00])
+
+# API RP 2GEO Table 5 - sand subgrade modulus k (MN/m³) against phi' (deg)
+TABLE5_PHI_DEG = np.array([25.0, 30.0, 35.0, 40.0])
+TABLE5_K_MNM3 = np.array([5.4, 11.0, 22.0, 45.0])
+
+
 # ============================================================================
 # UTILITY FUNCTIONS FOR INDUSTRY-STANDARD DISCRETIZATION
 # ============================================================================
 
+# Fractions of the peak resistance at which curves are discretized
+RATIOS_8_POINTS = np.array([0.10, 0.25, 0.40, 0.50, 0.65, 0.75, 0.90, 1.0])
+RATIOS_5_POINTS = np.array([0.10, 0.30, 0.50, 0.70, 1.0])
+
+# The curve shape tables are shared by every call: make them read-only so an
+# in-place edit on a returned or intermediate array cannot corrupt them
+for _table in (MATLOCK_P_RATIOS, MATLOCK_Y_RATIOS, MATLOCK_CYCLIC_SHALLOW_P_RATIOS,
+               MATLOCK_CYCLIC_SHALLOW_Y_RATIOS, REESE_P_RATIOS, REESE_Y_RATIOS,
+               REESE_CYCLIC_P_RATIOS, REESE_CYCLIC_Y_RATIOS, TZ_CLAY_Z_RATIOS,
+               TZ_CLAY_PEAK_T_RATIOS, TZ_SAND_Z_RATIOS, TZ_SAND_T_RATIOS, QZ_Z_D_RATIOS,
+               QZ_Q_RATIOS, TABLE5_PHI_DEG, TABLE5_K_MNM3, RATIOS_8_POINTS, RATIOS_5_POINTS):
+    _table.setflags(write=False)
+del _table
+
+# Wide-format table columns: (resistance, displacement) pairs point by point
+PY_TABLE_COLUMNS = ['Depth', 'Soil'] + [f'{x}{i}' for i in range(1, 6) for x in ('p', 'y')]
+TZ_TABLE_COLUMNS = ['Depth', 'Soil type'] + [f'{x}{i}' for i in range(1, 9) for x in ('t', 'z')]
+QZ_TABLE_COLUMNS = ['Depth', 'Soil type', 'tip'] + [f'{x}{i}' for i in range(1, 9) for x in ('q', 'z')]
+
+# Tables with no rows (no depth gave a curve); return copies
+_EMPTY_PY_TABLE = pd.DataFrame(columns=PY_TABLE_COLUMNS)
+_EMPTY_TZ_TABLE = pd.DataFrame(columns=TZ_TABLE_COLUMNS)
+_EMPTY_QZ_TABLE = pd.DataFrame(columns=QZ_TABLE_COLUMNS)
+
+
+def _wide_row(r_prefix: str, r_values: np.ndarray, d_prefix: str, d_values: np.ndarray) -> Dict:
+    """Interleaved wide-format row {r1, d1, r2, d2, ...} from two value arrays."""
+    result = {}
+    for i, (r, d) in enumerate(zip(r_values, d_values), start=1):
+        result[f'{r_prefix}{i}'] = r
+        result[f'{d_prefix}{i}'] = d
+    return result
+
+
 def discretize_tz_curve_8points(z_full: np.ndarray, t_full: np.ndarray) -> Dict:
     """
     Discretize t-z curve to enhanced 8-point format (WIDE FORMAT).
@@ -283,10 +366,6 @@ def discretize_tz_curve_8points(z_full: np.ndarray, t_full: np.ndarray) -> Dict:
 
     t_max = np.max(t_full)
 
-    # Use 8 evenly-spaced discretization points for better validation matching
-    target_ratios = [0.10, 0.25, 0.40, 0.50, 0.65, 0.75, 0.90, 1.0]
-    result = {}
-
     # Sort for interpolation
     if not np.all(np.diff(t_full) >= 0):
         sort_idx = np.argsort(t_full)
@@ -296,17 +375,13 @@ def discretize_tz_curve_8points(z_full: np.ndarray, t_full: np.ndarray) -> Dict:
         t_sorted = t_full
         z_sorted = z_full
 
-    for i, ratio in enumerate(target_ratios, start=1):
-        target_t = ratio * t_max
-
-        # Use interpolation to get unique z value for each t
-        z_interp = np.interp(target_t, t_sorted, z_sorted)
+    # 8 evenly-spaced points for better validation matching; interpolation
+    # gives a unique z for each t (all targets in one np.interp call)
+    target_t = RATIOS_8_POINTS * t_max
+    z_interp = np.interp(target_t, t_sorted, z_sorted)
 
-        # Convert units: t from kPa to MN/m, z from m to mm
-        result[f't{i}'] = target_t / 1000.0  # kPa to MN/m²
-        result[f'z{i}'] = z_interp * 1000.0  # m to mm
-
-    return result
+    # Convert units: t from kPa to MN/m, z from m to mm
+    return _wide_row('t', target_t / 1000.0, 'z', z_interp * 1000.0)
 
 
 def discretize_qz_curve_8points(z_full: np.ndarray, Q_full: np.ndarray) -> Dict:
@@ -337,10 +412,6 @@ def discretize_qz_curve_8points(z_full: np.ndarray, Q_full: np.ndarray) -> Dict:
 
     Q_max = np.max(Q_full)
 
-    # Use 8 evenly-spaced discretization points for better validation matching
-    target_ratios = [0.10, 0.25, 0.40, 0.50, 0.65, 0.75, 0.90, 1.0]
-    result = {}
-
     # Sort for interpolation
     if not np.all(np.diff(Q_full) >= 0):
         sort_idx = np.argsort(Q_full)
@@ -350,17 +421,13 @@ def discretize_qz_curve_8points(z_full: np.ndarray, Q_full: np.ndarray) -> Dict:
         Q_sorted = Q_full
         z_sorted = z_full
 
-    for i, ratio in enumerate(target_ratios, start=1):
-        target_Q = ratio * Q_max
+    # 8 evenly-spaced points for better validation matching; interpolation
+    # gives a unique z for each Q (all targets in one np.interp call)
+    target_Q = RATIOS_8_POINTS * Q_max
+    z_interp = np.interp(target_Q, Q_sorted, z_sorted)
 
-        # Use interpolation to get unique z value for each Q
-        z_interp = np.interp(target_Q, Q_sorted, z_sorted)
-
-        # Convert units: Q from kN to MN, z from m to mm
-        result[f'q{i}'] = target_Q / 1000.0  # kN to MN
-        result[f'z{i}'] = z_interp * 1000.0  # m to mm
-
-    return result
+    # Convert units: Q from kN to MN, z from m to mm
+    return _wide_row('q', target_Q / 1000.0, 'z', z_interp * 1000.0)
 
 
 def discretize_py_curve_8points(y_full: np.ndarray, p_full: np.ndarray) -> Dict:
@@ -397,10 +464,6 @@ def discretize_py_curve_8points(y_full: np.ndarray, p_full: np.ndarray) -> Dict:
         result.update({f'y{i+1}': 0.0 for i in range(num_points)})
         return result
 
-    # Use 8 evenly-spaced discretization points for better validation matching
-    target_ratios = [0.10, 0.25, 0.40, 0.50, 0.65, 0.75, 0.90, 1.0]
-    result = {}
-
     # Check if curve is monotonically increasing (p should increase with y for p-y curves)
     # If not monotonic, sort by p to enable interpolation
     if not np.all(np.diff(p_full) >= 0):
@@ -412,18 +475,13 @@ def discretize_py_curve_8points(y_full: np.ndarray, p_full: np.ndarray) -> Dict:
         p_sorted = p_full
         y_sorted = y_full
 
-    for i, ratio in enumerate(target_ratios, start=1):
-        target_p = ratio * p_max
-
-        # Use interpolation to find exact y value at target_p
-        # np.interp requires x (p_sorted) to be monotonically increasing
-        y_interp = np.interp(target_p, p_sorted, y_sorted)
+    # 8 evenly-spaced points for better validation matching; interpolation
+    # finds the exact y at each target p (np.interp needs p_sorted increasing)
+    target_p = RATIOS_8_POINTS * p_max
+    y_interp = np.interp(target_p, p_sorted, y_sorted)
 
-        # Convert units: p stays in kN/m, y from m to mm
-        result[f'p{i}'] = target_p  # Exact target value
-        result[f'y{i}'] = y_interp * 1000.0  # m to mm
-
-    return result
+    # Convert units: p stays in kN/m, y from m to mm
+    return _wide_row('p', target_p, 'y', y_interp * 1000.0)
 
 
 def discretize_py_curve_5points(y_full: np.ndarray, p_full: np.ndarray) -> Dict:
@@ -459,10 +517,6 @@ def discretize_py_curve_5points(y_full: np.ndarray, p_full: np.ndarray) -> Dict:
         result.update({f'y{i+1}': 0.0 for i in range(num_points)})
         return result
 
-    # Use 5 discretization points for p-y curves
-    target_ratios = [0.10, 0.30, 0.50, 0.70, 1.0]
-    result = {}
-
     # Check if curve is monotonically increasing (p should increase with y for p-y curves)
     # If not monotonic, sort by p to enable interpolation
     if not np.all(np.diff(p_full) >= 0):
@@ -474,27 +528,165 @@ def discretize_py_curve_5points(y_full: np.ndarray, p_full: np.ndarray) -> Dict:
         p_sorted = p_full
         y_sorted = y_full
 
-    for i, ratio in enumerate(target_ratios, start=1):
-        target_p = ratio * p_max
+    # 5 points for p-y curves; interpolation finds the exact y at each
+    # target p (np.interp needs p_sorted increasing)
+    target_p = RATIOS_5_POINTS * p_max
+    y_interp = np.interp(target_p, p_sorted, y_sorted)
 
-        # Use interpolation to find exact y value at target_p
-        # np.interp requires x (p_sorted) to be monotonically increasing
-        y_interp = np.interp(target_p, p_sorted, y_sorted)
+    # Convert units: p stays in kN/m, y from m to mm
+    return _wide_row('p', target_p, 'y', y_interp * 1000.0)
 
-        # Convert units: p stays in kN/m, y from m to mm
-        result[f'p{i}'] = target_p  # Exact target value
-        result[f'y{i}'] = y_interp * 1000.0  # m to mm
 
-    return result
+# ============================================================================
+# NUMERICAL KERNELS (JIT-compiled when numba is available)
+# ============================================================================
+
+@njit(cache=True)
+def _unit_shaft_friction_kernel(is_clay: np.ndarray, is_sand: np.ndarray,
+                                su: np.ndarray, p_o: np.ndarray,
+                                beta: np.ndarray, f_L: np.ndarray,
+                                for_tension: bool) -> np.ndarray:
+    """
+    Unit shaft friction (kPa) at each point of a depth grid.
+
+    Clay/silt points use the alpha method (Equations 17-18), sand points use
+    beta * p'o limited to f_L (Equation 21, API Table 1). Other points are 0.
+    """
+    n = su.shape[0]
+    f = np.zeros(n)
+    for i in range(n):
+        if is_clay[i]:
+            if not np.isfinite(su[i]) or su[i] <= 0:
+                continue
+
+            p_o_prime = p_o[i]
+            if p_o_prime <= 0:
+                p_o_prime = 1.0
 
+            # Alpha factor (Equation 18): exponent -0.5 for psi <= 1, -0.25 above,
+            # picked with a select rather than a branch
+            psi = su[i] / p_o_prime
+            alpha = min(0.5 * psi ** (-0.5 if psi <= 1.0 else -0.25), 1.0)
+
+            f[i] = alpha * su[i]
+
+            # Tension may be reduced (conservative 20% reduction)
+            if for_tension:
+                f[i] = 0.8 * f[i]
+        elif is_sand[i]:
+            if p_o[i] <= 0:
+                continue
+
+            # Limit to f_L per Table 1 (same friction in tension for driven piles)
+            f[i] = min(beta[i] * p_o[i], f_L[i])
+    return f
+
+
+@njit(cache=True)
+def _cumulative_friction_kernel(increments, n_points):
+    """
+    Shaft friction summed over the first n_points[j] grid increments, for each j.
+
+    n_points must be non-decreasing; the running sum is sequential, so each
+    entry equals increments[:n_points[j]].sum() taken left to right.
+    """
+    out = np.zeros(n_points.shape[0])
+    total = 0.0
+    k = 0
+    for j in range(n_points.shape[0]):
+        while k < n_points[j]:
+            total += increments[k]
+            k += 1
+        out[j] = total
+    return out
+
+
+def _interp_profile(x: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """
+    Piecewise-linear interpolation of a (depth, value) profile at depths x.
+
+    Values are held constant beyond the first/last point. Unlike np.interp,
+    a repeated depth takes the value of its first point (same as a linear
+    scan over the points). Returns NaN everywhere for an empty profile.
+    """
+    x = np.asarray(x, dtype=float)
+    out = np.full(x.shape, np.nan)
+    if len(xp) == 0:
+        return out
+
+    above = x <= xp[0]
+    below = x >= xp[-1]
+    inside = ~(above | below) & ~np.isnan(x)
+
+    # First point at or below each depth -> segment (i-1, i), with xp[i-1] < x <= xp[i]
+    i = np.searchsorted(xp, x[inside], side='left')
+    z1, z2 = xp[i - 1], xp[i]
+    v1, v2 = fp[i - 1], fp[i]
+    out[inside] = v1 + (x[inside] - z1) * (v2 - v1) / (z2 - z1)
+
+    out[below] = fp[-1]
+    out[above] = fp[0]
+    return out
+
+
+def _interp_rows(x: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """
+    np.interp row by row: x is (n, k), xp and fp are (n, m) with each xp row
+    non-decreasing. Uses the same arithmetic as np.interp, so for finite
+    inputs row r equals np.interp(x[r], xp[r], fp[r]).
+    """
+    n, m = xp.shape
+    # Last point at or below each x (for repeated points, the last of them)
+    j = (xp[:, None, :] <= x[:, :, None]).sum(axis=2) - 1
+    seg = np.clip(j, 0, m - 2)
+    rows = np.arange(n)[:, None]
+    x0, x1 = xp[rows, seg], xp[rows, seg + 1]
+    f0, f1 = fp[rows, seg], fp[rows, seg + 1]
+
+    # Clipped segments may have x0 == x1; those entries are replaced below
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = (f1 - f0) / (x1 - x0) * (x - x0) + f0
+    out = np.where(x == x0, f0, out)
+    out = np.where(j < 0, fp[:, :1], out)
+    return np.where(j >= m - 1, fp[:, -1:], out)
+
+
+# Guards the table caches used with _cached_table (class-level, shared by all threads)
+_TABLE_CACHE_LOCK = threading.Lock()
+
+
+def _cached_table(cache: Dict[tuple, pd.DataFrame], max_entries: int, key: tuple,
+                  build) -> pd.DataFrame:
+    """
+    Copy of the table cached under key, built with build() on a miss. Once
+    the cache holds max_entries tables, each insert evicts the oldest insert
+    (first in, first out; hits do not refresh an entry).
+    """
+    with _TABLE_CACHE_LOCK:
+        table = cache.get(key)
+    if table is None:
+        # Build outside the lock so one slow table does not hold up other threads
+        table = build()
+        with _TABLE_CACHE_LOCK:
+            if key not in cache:
+                if len(cache) >= max_entries:
+                    del cache[next(iter(cache))]
+                cache[key] = table
+    return table.copy()
 
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+# Sort key for SoilPoint lists (C-level, avoids a Python lambda per comparison)
+_by_depth = attrgetter('depth_m')
+
+
+@dataclass(frozen=True)
 class SoilPoint:
     """Single measurement point of soil parameter at specific depth."""
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ('depth_m', 'value')
     depth_m: float
     value: float
 
@@ -504,6 +696,14 @@ class SoilPoint:
         if self.value < 0:
             raise ValueError(f"Value must be non-negative, got {self.value}")
 
+    def __reduce__(self):
+        # Frozen slotted instances cannot be restored by setattr; rebuild instead
+        return (SoilPoint, (self.depth_m, self.value))
+
+    def __lt__(self, other: 'SoilPoint') -> bool:
+        # Depth-only ordering, so bisect.insort places a new point after equal depths
+        return self.depth_m < other.depth_m
+
 
 @dataclass
 class SoilLayer:
@@ -530,54 +730,77 @@ class SoilLayer:
     OCR: float = 1.0
     PI: float = 0.0
 
+    # Depth/value arrays per property, built on first use (see _property_arrays)
+    _arrays: Dict[str, tuple] = field(default_factory=dict, init=False,
+                                      repr=False, compare=False)
+
     def __post_init__(self):
         if self.depth_bot_m <= self.depth_top_m:
             raise ValueError(f"depth_bot must be > depth_top")
 
-        # Sort all profiles by depth
+        # Sort all profiles by depth (usually already sorted - skip those)
         for profile in [self.gamma_prime_kNm3, self.su_kPa, self.phi_prime_deg,
                        self.E50_kPa, self.k_kNm3, self.epsilon_50_pct]:
-            profile.sort(key=lambda p: p.depth_m)
+            if any(a.depth_m > b.depth_m for a, b in zip(profile, profile[1:])):
+                profile.sort(key=_by_depth)
 
-    def get_property_at_depth(self, depth_m: float, property_name: str) -> float:
-        """Interpolate property value at given depth."""
+    def _property_points(self, property_name: str) -> List[SoilPoint]:
+        """Return the SoilPoint profile for a property name."""
         if property_name == "gamma_prime":
-            profile = self.gamma_prime_kNm3
+            return self.gamma_prime_kNm3
         elif property_name == "su":
-            profile = self.su_kPa
+            return self.su_kPa
         elif property_name == "phi_prime":
-            profile = self.phi_prime_deg
+            return self.phi_prime_deg
         elif property_name == "E50":
-            profile = self.E50_kPa
+            return self.E50_kPa
         elif property_name == "k":
-            profile = self.k_kNm3
+            return self.k_kNm3
         elif property_name == "epsilon_50":
-            profile = self.epsilon_50_pct
+            return self.epsilon_50_pct
         else:
             raise ValueError(f"Unknown property: {property_name}")
 
-        abs_depth = self.depth_top_m + depth_m
+    def add_point(self, property_name: str, point: SoilPoint) -> None:
+        """Insert a point into a property profile, keeping it sorted by depth."""
+        insort(self._property_points(property_name), point)
+
+    def _property_arrays(self, property_name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (depths, values) arrays for a property, cached per point contents."""
+        points = tuple(self._property_points(property_name))
+        cached = self._arrays.get(property_name)
+        # Rebuild if points were added, removed or replaced (SoilPoint is frozen,
+        # so equal points mean equal arrays)
+        if cached is None or cached[0] != points:
+            depths = np.fromiter((p.depth_m for p in points), dtype=float, count=len(points))
+            values = np.fromiter((p.value for p in points), dtype=float, count=len(points))
+            cached = (points, depths, values)
+            self._arrays[property_name] = cached
+        return cached[1], cached[2]
+
+    def get_property_profile(self, depths_m: np.ndarray, property_name: str) -> np.ndarray:
+        """Interpolate property values at an array of depths (relative to layer top)."""
+        depths, values = self._property_arrays(property_name)
+
+        abs_depths = self.depth_top_m + np.asarray(depths_m, dtype=float)
+        return _interp_profile(abs_depths, depths, values)
 
-        if not profile:
+    def get_property_at_depth(self, depth_m: float, property_name: str) -> float:
+        """Interpolate property value at given depth."""
+        # Scalar version of _interp_profile (no temporary arrays per call)
+        depths, values = self._property_arrays(property_name)
+        z = self.depth_top_m + depth_m
+        if len(depths) == 0 or z != z:
             return np.nan
+        if z <= depths[0]:
+            return float(values[0])
+        if z >= depths[-1]:
+            return float(values[-1])
 
-        if abs_depth <= profile[0].depth_m:
-            return profile[0].value
-        if abs_depth >= profile[-1].depth_m:
-            return profile[-1].value
-
-        # Linear interpolation
-        for i in range(1, len(profile)):
-            if profile[i-1].depth_m <= abs_depth <= profile[i].depth_m:
-                z1, v1 = profile[i-1].depth_m, profile[i-1].value
-                z2, v2 = profile[i].depth_m, profile[i].value
-
-                if z2 == z1:
-                    return v1
-
-                return v1 + (abs_depth - z1) * (v2 - v1) / (z2 - z1)
-
-        return np.nan
+        i = int(np.searchsorted(depths, z, side='left'))
+        z1, z2 = depths[i - 1], depths[i]
+        v1, v2 = values[i - 1], values[i]
+        return float(v1 + (z - z1) * (v2 - v1) / (z2 - z1))
 
     def get_relative_density_class(self) -> RelativeDensity:
         """Get relative density classification."""
@@ -615,15 +838,66 @@ class SoilProfile:
     water_depth_m: float = 0.0
     seafloor_elevation_m: float = 0.0
 
-    def get_layer_at_depth(self, depth_m: float) -> Optional[SoilLayer]:
-        """Get soil layer containing the given depth."""
-        # Add small tolerance for boundary cases (e.g., depth exactly at layer bottom)
-        tolerance = 0.001  # 1mm tolerance
+    # Cumulative overburden per integration step, built on first use
+    # (see _cumulative_overburden)
+    _stress_cache: Dict[float, tuple] = field(default_factory=dict, init=False,
+                                              repr=False, compare=False)
+
+    # Small tolerance for boundary cases (e.g., depth exactly at layer bottom)
+    _DEPTH_TOLERANCE_M = 0.001  # 1mm
 
-        for layer in self.layers:
+    def _layer_index_at_depth(self, depth_m: float) -> int:
+        """Index of the soil layer containing the given depth (-1 if none)."""
+        tolerance = self._DEPTH_TOLERANCE_M
+
+        for i, layer in enumerate(self.layers):
             if layer.depth_top_m <= depth_m <= layer.depth_bot_m + tolerance:
-                return layer
-        return None
+                return i
+        return -1
+
+    def _layer_indices(self, depths_m: np.ndarray) -> np.ndarray:
+        """_layer_index_at_depth for an array of depths."""
+        depths = np.asarray(depths_m, dtype=float)
+        tops = np.array([layer.depth_top_m for layer in self.layers], dtype=float)
+        ends = np.array([layer.depth_bot_m for layer in self.layers], dtype=float) + self._DEPTH_TOLERANCE_M
+
+        # Layers in depth order (the usual case): binary search on the bottoms.
+        # The first layer that does not end above a depth is the only candidate.
+        if len(tops) and (np.diff(tops) >= 0).all() and (np.diff(ends) >= 0).all():
+            layer_idx = np.searchsorted(ends, depths, side='left')
+            found = (layer_idx < len(ends)) & (tops[np.minimum(layer_idx, len(ends) - 1)] <= depths)
+            return np.where(found, layer_idx, -1)
+
+        # Otherwise one mask per layer
+        layer_idx = np.full(depths.shape, -1, dtype=int)
+        # Deepest first, so the first matching layer wins where bounds touch
+        for i in range(len(self.layers) - 1, -1, -1):
+            layer = self.layers[i]
+            inside = (depths >= layer.depth_top_m) & (depths <= layer.depth_bot_m + self._DEPTH_TOLERANCE_M)
+            layer_idx[inside] = i
+        return layer_idx
+
+    def _soil_type_masks(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Per-layer clay and sand flags, with an extra False entry at the end so
+        that index -1 (no layer, see _layer_indices) reads as neither.
+        """
+        is_clay = np.array([layer.soil_type in CLAY_SOIL_TYPES for layer in self.layers] + [False])
+        is_sand = np.array([layer.soil_type in SAND_SOIL_TYPES for layer in self.layers] + [False])
+        return is_clay, is_sand
+
+    def _value_signature(self) -> tuple:
+        """Layer types, bounds, relative densities and property points, by value."""
+        return tuple((layer.soil_type, layer.depth_top_m, layer.depth_bot_m,
+                      layer.relative_density_pct, tuple(layer.gamma_prime_kNm3),
+                      tuple(layer.su_kPa), tuple(layer.phi_prime_deg), tuple(layer.E50_kPa),
+                      tuple(layer.k_kNm3), tuple(layer.epsilon_50_pct))
+                     for layer in self.layers)
+
+    def get_layer_at_depth(self, depth_m: float) -> Optional[SoilLayer]:
+        """Get soil layer containing the given depth."""
+        i = self._layer_index_at_depth(depth_m)
+        return self.layers[i] if i >= 0 else None
 
     def get_property_at_depth(self, depth_m: float, property_name: str) -> float:
         """Get interpolated property at given depth."""
@@ -634,23 +908,62 @@ class SoilProfile:
         relative_depth = depth_m - layer.depth_top_m
         return layer.get_property_at_depth(relative_depth, property_name)
 
+    def get_property_profile(self, depths_m: np.ndarray, property_name: str) -> np.ndarray:
+        """Get interpolated property at an array of depths (NaN outside all layers)."""
+        depths = np.asarray(depths_m, dtype=float)
+        layer_idx = self._layer_indices(depths)
+        values = np.full(depths.shape, np.nan)
+
+        for i in np.unique(layer_idx[layer_idx >= 0]):
+            layer = self.layers[i]
+            mask = layer_idx == i
+            values[mask] = layer.get_property_profile(depths[mask] - layer.depth_top_m, property_name)
+
+        return values
+
+    def _cumulative_overburden(self, dz: float) -> np.ndarray:
+        """
+        Effective vertical stress integrated from the seafloor to each point
+        of the grid 0, dz, 2*dz, ... (trapezoid rule, skipping depths with no
+        gamma' data), cached until the layers or their gamma' profiles change.
+        """
+        # By value, so gamma' points replaced in place also rebuild the cache
+        signature = tuple((layer.depth_top_m, layer.depth_bot_m, tuple(layer.gamma_prime_kNm3))
+                          for layer in self.layers)
+        cached = self._stress_cache.get(dz)
+        if cached is None or cached[0] != signature:
+            # Past the deepest layer (plus boundary tolerance) there is no gamma' data
+            bottom = max((layer.depth_bot_m for layer in self.layers), default=0.0)
+            depths = np.arange(0, bottom + self._DEPTH_TOLERANCE_M + 2 * dz, dz)
+            gamma_primes = self.get_property_profile(depths, "gamma_prime")
+
+            valid_mask = ~np.isnan(gamma_primes)
+            z, g = depths[valid_mask], gamma_primes[valid_mask]
+            cum_valid = np.concatenate(([0.0], np.cumsum(np.diff(z) * (g[1:] + g[:-1]) / 2.0)))
+
+            # Hold the running total over grid points with no data
+            last_valid = np.cumsum(valid_mask) - 1
+            cumulative = np.where(last_valid >= 0, cum_valid[np.maximum(last_valid, 0)], 0.0)
+            cached = (signature, cumulative)
+            self._stress_cache[dz] = cached
+        return cached[1]
+
     def calculate_overburden_stress(self, depth_m: float, dz: float = 0.1) -> float:
         """Calculate effective vertical stress at depth by integration."""
         if depth_m <= 0:
             return 0.0
 
-        depths = np.arange(0, depth_m + dz, dz)
-        gamma_primes = np.array([self.get_property_at_depth(z, "gamma_prime")
-                                 for z in depths])
+        # Same grid as np.arange(0, depth_m + dz, dz), read from the cumulative integral
+        cumulative = self._cumulative_overburden(dz)
+        n_points = int(np.ceil((depth_m + dz) / dz))
+        return float(cumulative[min(n_points, len(cumulative)) - 1])
 
-        valid_mask = ~np.isnan(gamma_primes)
-        gamma_primes = gamma_primes[valid_mask]
-        depths = depths[valid_mask]
-
-        if len(gamma_primes) < 2:
-            return 0.0
-
-        return float(np.trapz(gamma_primes, depths))
+    def overburden_stress_profile(self, depths_m: np.ndarray, dz: float = 0.1) -> np.ndarray:
+        """calculate_overburden_stress at an array of depths."""
+        depths = np.nan_to_num(np.asarray(depths_m, dtype=float), nan=0.0)
+        cumulative = self._cumulative_overburden(dz)
+        n_points = np.clip(np.ceil((depths + dz) / dz), 1, len(cumulative)).astype(int)
+        return np.where(depths > 0, cumulative[n_points - 1], 0.0)
 
 
 # ============================================================================
@@ -660,6 +973,9 @@ class SoilProfile:
 class AxialCapacity:
     """Compute axial pile capacity per API RP 2GEO Section 8.1 (Enhanced)."""
 
+    # Depth step (m) of the shaft friction integration grid
+    SHAFT_DZ = 0.25
+
     @staticmethod
     def clay_shaft_friction(depth_m: float, profile: SoilProfile,
                             pile: PileProperties, for_tension: bool = False) -> float:
@@ -675,26 +991,32 @@ class AxialCapacity:
 
         p_o_prime = profile.calculate_overburden_stress(depth_m)
 
-        if p_o_prime <= 0:
-            p_o_prime = 1.0
-
-        # Alpha factor (Equation 18)
-        psi = su / p_o_prime
-
-        if psi <= 1.0:
-            alpha = 0.5 * (psi ** -0.5)
-        else:
-            alpha = 0.5 * (psi ** -0.25)
-
-        alpha = min(alpha, 1.0)
+        f = _unit_shaft_friction_kernel(
+            np.array([True]), np.array([False]), np.array([su]), np.array([p_o_prime]),
+            np.zeros(1), np.zeros(1), for_tension
+        )
+        return float(f[0])
 
-        f_compression = alpha * su
+    @staticmethod
+    def sand_friction_parameters(layer: SoilLayer) -> Tuple[float, float]:
+        """
+        Return (beta, f_L_kPa) for a sand layer from API Table 1.
 
-        # Tension may be reduced (conservative)
-        if for_tension:
-            return 0.8 * f_compression  # Conservative 20% reduction
+        Falls back to a conservative estimate (with a warning) for soil types
+        not in Table 1.
+        """
+        dr_class = layer.get_relative_density_class().value
+        soil_desc = layer.soil_type.value
+        
+        key = (dr_class, soil_desc)
         
-        return f_compression
+        if key in API_TABLE_1_EXTENDED and API_TABLE_1_EXTENDED[key]["beta"] is not None:
+            return API_TABLE_1_EXTENDED[key]["beta"], API_TABLE_1_EXTENDED[key]["f_L_kPa"]
+
+        # Fallback for soil types not in Table 1 (should rarely happen now)
+        warnings.warn(f"Soil type {key} not in API Table 1, using conservative estimate")
+        # Apply conservative limit even in fallback
+        return 0.25, 50.0  # f_L = 50 kPa (conservative default)
 
     @staticmethod
     def sand_shaft_friction(depth_m: float, profile: SoilProfile,
@@ -706,7 +1028,7 @@ class AxialCapacity:
         """
         layer = profile.get_layer_at_depth(depth_m)
         
-        if layer is None or layer.soil_type not in [SoilType.SAND, SoilType.SAND_SILT]:
+        if layer is None or layer.soil_type not in SAND_SOIL_TYPES:
             return 0.0
 
         p_o_prime = profile.calculate_overburden_stress(depth_m)
@@ -715,35 +1037,69 @@ class AxialCapacity:
             return 0.0
 
         # Get API Table 1 parameters
-        dr_class = layer.get_relative_density_class().value
-        soil_desc = layer.soil_type.value
-        
-        key = (dr_class, soil_desc)
-        
-        if key in API_TABLE_1_EXTENDED and API_TABLE_1_EXTENDED[key]["beta"] is not None:
-            beta = API_TABLE_1_EXTENDED[key]["beta"]
-            f_L = API_TABLE_1_EXTENDED[key]["f_L_kPa"]
+        beta, f_L = AxialCapacity.sand_friction_parameters(layer)
 
-            # Calculate unit friction
-            f_calc = beta * p_o_prime
+        f = _unit_shaft_friction_kernel(
+            np.array([False]), np.array([True]), np.full(1, np.nan), np.array([p_o_prime]),
+            np.array([beta], dtype=float), np.array([f_L], dtype=float), for_tension
+        )
+        return float(f[0])
 
-            # Limit to f_L per Table 1
-            f_compression = min(f_calc, f_L)
-        else:
-            # Fallback for soil types not in Table 1 (should rarely happen now)
-            warnings.warn(f"Soil type {key} not in API Table 1, using conservative estimate")
-            beta = 0.25
-            f_calc = beta * p_o_prime
-            # Apply conservative limit even in fallback
-            f_L_conservative = 50.0  # kPa (conservative default)
-            f_compression = min(f_calc, f_L_conservative)
-
-        # Tension handling
-        if for_tension:
-            # API allows same friction in tension for driven piles
-            return f_compression
+    @classmethod
+    def _shaft_friction_inputs(cls, depths_m: np.ndarray, profile: SoilProfile
+                               ) -> Tuple[List[Optional[SoilLayer]], tuple]:
+        """
+        Layer found at each depth (None outside the profile) and the
+        per-depth arrays _unit_shaft_friction_kernel takes before for_tension.
+        """
+        layer_idx = profile._layer_indices(depths_m)
+        layers = [profile.layers[i] if i >= 0 else None for i in layer_idx.tolist()]
+        n = len(layers)
+
+        clay_layers, sand_layers = profile._soil_type_masks()
+        is_clay = clay_layers[layer_idx]
+        is_sand = sand_layers[layer_idx]
+        su = profile.get_property_profile(depths_m, "su")
+        # The kernel only reads p'o where su > 0 (clay) or at sand points
+        p_o = profile.overburden_stress_profile(depths_m)
+        beta = np.zeros(n)
+        f_L = np.zeros(n)
+
+        # Table 1 parameters are per layer: fill them one sand layer at a time
+        for i in np.flatnonzero(sand_layers):
+            in_layer = layer_idx == i
+            if (p_o[in_layer] > 0).any():
+                beta[in_layer], f_L[in_layer] = cls.sand_friction_parameters(profile.layers[i])
+
+        return layers, (is_clay, is_sand, su, p_o, beta, f_L)
+
+    @classmethod
+    def unit_shaft_friction_profile(cls, depths_m: np.ndarray, profile: SoilProfile,
+                                    pile: PileProperties, for_tension: bool = False
+                                    ) -> Tuple[np.ndarray, List[Optional[SoilLayer]]]:
+        """
+        Unit shaft friction (kPa) at every depth of a grid in one kernel call.
 
-        return f_compression
+        Returns the friction array and the layer found at each depth (None
+        outside the profile).
+        """
+        layers, kernel_inputs = cls._shaft_friction_inputs(depths_m, profile)
+        f = _unit_shaft_friction_kernel(*kernel_inputs, for_tension)
+        return f, layers
+
+    @classmethod
+    def unit_shaft_friction_profiles(cls, depths_m: np.ndarray, profile: SoilProfile,
+                                     pile: PileProperties
+                                     ) -> Tuple[np.ndarray, np.ndarray, List[Optional[SoilLayer]]]:
+        """
+        unit_shaft_friction_profile for compression and tension, sharing the
+        layer lookup and soil property profiles.
+
+        Returns the compression and tension friction arrays and the layers.
+        """
+        layers, kernel_inputs = cls._shaft_friction_inputs(depths_m, profile)
+        return (_unit_shaft_friction_kernel(*kernel_inputs, False),
+                _unit_shaft_friction_kernel(*kernel_inputs, True), layers)
 
     @staticmethod
     def end_bearing_clay(depth_m: float, profile: SoilProfile,
@@ -766,7 +1122,7 @@ class AxialCapacity:
         """
         layer = profile.get_layer_at_depth(depth_m)
         
-        if layer is None or layer.soil_type not in [SoilType.SAND, SoilType.SAND_SILT]:
+        if layer is None or layer.soil_type not in SAND_SOIL_TYPES:
             return 0.0
 
         p_o_tip = profile.calculate_overburden_stress(depth_m)
@@ -803,6 +1159,44 @@ class AxialCapacity:
 
             return 0.0
 
+    @classmethod
+    def unit_end_bearing_profile(cls, depths_m: np.ndarray, profile: SoilProfile,
+                                 pile: PileProperties) -> np.ndarray:
+        """
+        Unit end bearing (kPa) at every depth of a grid: end_bearing_clay in
+        clay/silt layers, end_bearing_sand elsewhere (0 outside the profile).
+        """
+        depths = np.asarray(depths_m, dtype=float)
+        layer_idx = profile._layer_indices(depths)
+        clay_layers, sand_layers = profile._soil_type_masks()
+
+        su = profile.get_property_profile(depths, "su")
+        q = np.where(clay_layers[layer_idx] & np.isfinite(su) & (su > 0), 9.0 * su, 0.0)  # Nc = 9
+
+        # Sand: Table 1 parameters are per layer, so fill one sand layer at a time
+        p_o = profile.overburden_stress_profile(depths)
+        for i in np.flatnonzero(sand_layers):
+            at_tip = (layer_idx == i) & (p_o > 0)
+            if not at_tip.any():
+                continue
+
+            layer = profile.layers[i]
+            key = (layer.get_relative_density_class().value, layer.soil_type.value)
+            if key in API_TABLE_1_EXTENDED and API_TABLE_1_EXTENDED[key]["Nq"] is not None:
+                Nq = API_TABLE_1_EXTENDED[key]["Nq"]
+                q_L = API_TABLE_1_EXTENDED[key]["q_L_MPa"] * 1000  # Convert to kPa
+                q[at_tip] = np.minimum(Nq * p_o[at_tip], q_L)
+            else:
+                # Same fallback as end_bearing_sand
+                warnings.warn(f"Soil type {key} not in API Table 1, using conservative estimate with limit")
+                phi_prime = profile.get_property_profile(depths[at_tip], "phi_prime")
+                has_phi = np.isfinite(phi_prime) & (phi_prime > 0)
+                phi_rad = np.deg2rad(np.where(has_phi, phi_prime, 0.0))
+                Nq = np.exp(np.pi * np.tan(phi_rad)) * np.tan(np.pi/4 + phi_rad/2)**2
+                q[at_tip] = np.where(has_phi, np.minimum(Nq * p_o[at_tip], 5000.0), 0.0)
+
+        return q
+
     @staticmethod
     def check_penetration_requirement(depth_m: float, pile: PileProperties,
                                      layer: SoilLayer) -> Tuple[bool, str]:
@@ -822,6 +1216,66 @@ class AxialCapacity:
         else:
             return True, f"Good penetration: {penetration:.1f}m (> 3D)"
 
+    @classmethod
+    def _tip_end_bearing(cls, profile: SoilProfile, pile: PileProperties,
+                         depth_m: float) -> Tuple[float, str]:
+        """End bearing (kN, unfactored) and penetration status for a tip at depth_m."""
+        end_bearing_kN = 0.0
+        penetration_status = "N/A"
+
+        tip_layer = profile.get_layer_at_depth(depth_m)
+
+        if tip_layer is not None:
+            # Check penetration
+            meets_req, pen_msg = cls.check_penetration_requirement(depth_m, pile, tip_layer)
+            penetration_status = pen_msg
+
+            if meets_req:
+                if tip_layer.soil_type in CLAY_SOIL_TYPES:
+                    q = cls.end_bearing_clay(depth_m, profile, pile)
+                else:
+                    q = cls.end_bearing_sand(depth_m, profile, pile)
+
+                end_bearing_kN = q * pile.area_gross_m2
+            else:
+                penetration_status = f"WARNING: {pen_msg}"
+
+        return end_bearing_kN, penetration_status
+
+    @classmethod
+    def _tip_end_bearing_profile(cls, profile: SoilProfile, pile: PileProperties,
+                                 depths: np.ndarray, layers: List[Optional[SoilLayer]]
+                                 ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        _tip_end_bearing at every depth of a grid, given the layer at each
+        depth (None outside the profile). End bearing is computed in one pass
+        over the depths that meet the penetration requirement.
+        """
+        end_bearing_kN = np.zeros(len(depths))
+        penetration_status = np.full(len(depths), "N/A", dtype=object)
+        meets = np.zeros(len(depths), dtype=bool)
+
+        for i, (depth, layer) in enumerate(zip(depths.tolist(), layers)):
+            if layer is None:
+                continue
+            meets_req, pen_msg = cls.check_penetration_requirement(depth, pile, layer)
+            meets[i] = meets_req
+            penetration_status[i] = pen_msg if meets_req else f"WARNING: {pen_msg}"
+
+        end_bearing_kN[meets] = cls.unit_end_bearing_profile(depths[meets], profile, pile) * pile.area_gross_m2
+        return end_bearing_kN, penetration_status
+
+    @staticmethod
+    def default_resistance_factor(pile: PileProperties, for_tension: bool) -> float:
+        """LRFD resistance factor for the pile type and loading direction."""
+        if pile.pile_type in (PileType.DRIVEN_PIPE_OPEN, PileType.DRIVEN_PIPE_CLOSED):
+            if for_tension:
+                return RESISTANCE_FACTORS["axial_tension_driven"]
+            return RESISTANCE_FACTORS["axial_compression_driven"]
+        if for_tension:
+            return RESISTANCE_FACTORS["axial_tension_drilled"]
+        return RESISTANCE_FACTORS["axial_compression_drilled"]
+
     @classmethod
     def total_capacity_layered(cls, profile: SoilProfile, pile: PileProperties,
                               depth_m: float, loading_type: LoadingType = LoadingType.COMPRESSION,
@@ -852,36 +1306,26 @@ class AxialCapacity:
         for_tension = (loading_type == LoadingType.TENSION)
 
         # Shaft friction by integration with layer tracking
-        dz = 0.25
+        dz = cls.SHAFT_DZ
         depths = np.arange(0, depth_m, dz)
-        
-        total_friction_kN = 0.0
+
+        # Circumference
+        perimeter = np.pi * pile.diameter_m
+
+        # Unit friction for the whole grid, then friction over each interval
+        f_z, layers = cls.unit_shaft_friction_profile(depths, profile, pile, for_tension)
+        increments = f_z * perimeter * dz
+        total_friction_kN = float(np.cumsum(increments)[-1]) if len(increments) else 0.0
+
+        # Track per-layer contributions
         layer_contributions = []
         current_layer_name = None
         current_layer_friction = 0.0
 
-        for z in depths:
-            layer = profile.get_layer_at_depth(z)
-            
+        for layer, friction_increment in zip(layers, increments.tolist()):
             if layer is None:
                 continue
 
-            # Get unit friction based on soil type
-            if layer.soil_type in [SoilType.CLAY, SoilType.SILT]:
-                f_z = cls.clay_shaft_friction(z, profile, pile, for_tension)
-            elif layer.soil_type in [SoilType.SAND, SoilType.SAND_SILT]:
-                f_z = cls.sand_shaft_friction(z, profile, pile, for_tension)
-            else:
-                f_z = 0.0
-
-            # Circumference
-            perimeter = np.pi * pile.diameter_m
-
-            # Add friction over interval
-            friction_increment = f_z * perimeter * dz
-            total_friction_kN += friction_increment
-
-            # Track per-layer contributions
             if layer.name != current_layer_name:
                 if current_layer_name is not None:
                     layer_contributions.append({
@@ -901,43 +1345,17 @@ class AxialCapacity:
             })
 
         # End bearing (only for compression)
-        end_bearing_kN = 0.0
-        penetration_status = "N/A"
-        
-        if not for_tension:
-            tip_layer = profile.get_layer_at_depth(depth_m)
-            
-            if tip_layer is not None:
-                # Check penetration
-                meets_req, pen_msg = cls.check_penetration_requirement(depth_m, pile, tip_layer)
-                penetration_status = pen_msg
-
-                if meets_req:
-                    if tip_layer.soil_type in [SoilType.CLAY, SoilType.SILT]:
-                        q = cls.end_bearing_clay(depth_m, profile, pile)
-                    else:
-                        q = cls.end_bearing_sand(depth_m, profile, pile)
-
-                    end_bearing_kN = q * pile.area_gross_m2
-                else:
-                    penetration_status = f"WARNING: {pen_msg}"
+        if for_tension:
+            end_bearing_kN, penetration_status = 0.0, "N/A"
+        else:
+            end_bearing_kN, penetration_status = cls._tip_end_bearing(profile, pile, depth_m)
 
         # Total capacity
         total_capacity_kN = total_friction_kN + end_bearing_kN
 
         # Apply resistance factor if LRFD
         if resistance_factor is None:
-            # Determine appropriate resistance factor
-            if pile.pile_type in [PileType.DRIVEN_PIPE_OPEN, PileType.DRIVEN_PIPE_CLOSED]:
-                if for_tension:
-                    resistance_factor = RESISTANCE_FACTORS["axial_tension_driven"]
-                else:
-                    resistance_factor = RESISTANCE_FACTORS["axial_compression_driven"]
-            else:
-                if for_tension:
-                    resistance_factor = RESISTANCE_FACTORS["axial_tension_drilled"]
-                else:
-                    resistance_factor = RESISTANCE_FACTORS["axial_compression_drilled"]
+            resistance_factor = cls.default_resistance_factor(pile, for_tension)
 
         total_capacity_kN *= resistance_factor
 
@@ -960,39 +1378,95 @@ class AxialCapacity:
         
         IMPROVEMENT: Layer-by-layer results with validation status
         """
+        for_tension = (loading_type == LoadingType.TENSION)
+        depths, grid = cls._capacity_grids(max_depth_m, dz)
+        n = len(depths)
+
+        # Instantaneous unit friction at each depth (not average) and on the
+        # shaft grid, from one layer lookup and kernel call over both
+        f, layers = cls.unit_shaft_friction_profile(np.concatenate((depths, grid)),
+                                                    profile, pile, for_tension)
+
+        return cls._capacity_profile_frame(profile, pile, depths, layers[:n], f[:n],
+                                           f[n:], for_tension, resistance_factor)
+
+    @classmethod
+    def compute_capacity_profiles(cls, profile: SoilProfile, pile: PileProperties,
+                                  max_depth_m: float, dz: float = 0.5,
+                                  resistance_factor: Optional[float] = None
+                                  ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        compute_capacity_profile for compression and tension, sharing the
+        depth grids, layer lookups and soil property profiles.
+
+        Returns the (compression, tension) profiles.
+        """
+        depths, grid = cls._capacity_grids(max_depth_m, dz)
+        n = len(depths)
+        f_comp, f_tens, layers = cls.unit_shaft_friction_profiles(np.concatenate((depths, grid)),
+                                                                  profile, pile)
+        layers = layers[:n]
+
+        return (
+            cls._capacity_profile_frame(profile, pile, depths, layers, f_comp[:n],
+                                        f_comp[n:], False, resistance_factor),
+            cls._capacity_profile_frame(profile, pile, depths, layers, f_tens[:n],
+                                        f_tens[n:], True, resistance_factor),
+        )
+
+    @classmethod
+    def _capacity_grids(cls, max_depth_m: float, dz: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Output depths of a capacity profile and its shaft integration grid."""
         depths = np.arange(0, max_depth_m + dz, dz)
-        results_list = []
 
-        for z in depths:
-            result = cls.total_capacity_layered(profile, pile, z, loading_type, resistance_factor)
+        # total_capacity_layered(z) sums the first ceil(z / SHAFT_DZ) increments
+        # of this grid, so one pass over it serves every output depth
+        shaft_depth = float(depths[-1]) if len(depths) else 0.0
+        return depths, np.arange(0, shaft_depth, cls.SHAFT_DZ)
 
-            layer = profile.get_layer_at_depth(z)
+    @classmethod
+    def _capacity_profile_frame(cls, profile: SoilProfile, pile: PileProperties,
+                                depths: np.ndarray, layers: List[Optional[SoilLayer]],
+                                unit_friction: np.ndarray, f_grid: np.ndarray,
+                                for_tension: bool,
+                                resistance_factor: Optional[float]) -> pd.DataFrame:
+        """Capacity profile table from the unit friction at the depths and on the shaft grid."""
+        unit_friction[depths <= 0] = 0.0
+
+        # Shaft friction to every depth as a prefix sum of the grid increments
+        increments = f_grid * (np.pi * pile.diameter_m) * cls.SHAFT_DZ
+        n_points = np.clip(np.ceil(depths / cls.SHAFT_DZ), 0, len(f_grid)).astype(np.int64)
+        shaft_kN = _cumulative_friction_kernel(increments, n_points)
 
-            # Calculate instantaneous unit friction at this depth (not average)
-            for_tension = (loading_type == LoadingType.TENSION)
-            if layer and z > 0:
-                if layer.soil_type in [SoilType.CLAY, SoilType.SILT]:
-                    unit_friction_at_depth = cls.clay_shaft_friction(z, profile, pile, for_tension)
-                elif layer.soil_type in [SoilType.SAND, SoilType.SAND_SILT]:
-                    unit_friction_at_depth = cls.sand_shaft_friction(z, profile, pile, for_tension)
-                else:
-                    unit_friction_at_depth = 0.0
-            else:
-                unit_friction_at_depth = 0.0
-
-            results_list.append({
-                'depth_m': z,
-                'layer': layer.name if layer else "N/A",
-                'soil_type': layer.soil_type.value if layer else "N/A",
-                'unit_friction_kPa': unit_friction_at_depth,
-                'cumulative_friction_kN': result['shaft_friction_kN'],
-                'end_bearing_kPa': result['end_bearing_kN'] / pile.area_gross_m2 if pile.area_gross_m2 > 0 else 0,
-                'total_capacity_kN': result['total_capacity_kN'],
-                'penetration_status': result['penetration_status'],
-                'resistance_factor': result['applied_resistance_factor'],
-            })
+        if resistance_factor is None:
+            resistance_factor = cls.default_resistance_factor(pile, for_tension)
 
-        return pd.DataFrame(results_list)
+        # Non-positive depths: same as total_capacity_layered(), no capacity
+        positive = depths > 0
+        factor = np.where(positive, resistance_factor, 1.0)
+        shaft_kN = np.where(positive, shaft_kN, 0.0)
+
+        end_bearing_kN = np.zeros(len(depths))
+        penetration_status = np.where(positive, "N/A", "Invalid depth").astype(object)
+        if not for_tension:
+            tip = np.flatnonzero(positive)
+            end_bearing_kN[tip], penetration_status[tip] = cls._tip_end_bearing_profile(
+                profile, pile, depths[tip], [layers[i] for i in tip])
+
+        end_bearing_kPa = (end_bearing_kN * factor / pile.area_gross_m2 if pile.area_gross_m2 > 0
+                           else np.zeros(len(depths)))
+
+        return pd.DataFrame({
+            'depth_m': depths,
+            'layer': [layer.name if layer else "N/A" for layer in layers],
+            'soil_type': [layer.soil_type.value if layer else "N/A" for layer in layers],
+            'unit_friction_kPa': unit_friction,
+            'cumulative_friction_kN': shaft_kN * factor,
+            'end_bearing_kPa': end_bearing_kPa,
+            'total_capacity_kN': (shaft_kN + end_bearing_kN) * factor,
+            'penetration_status': penetration_status,
+            'resistance_factor': factor,
+        })
 
 
 # ============================================================================
@@ -1003,12 +1477,26 @@ class LateralCapacity:
     """Compute lateral pile capacity with proper API RP 2GEO compliance."""
 
     @staticmethod
-    def calculate_C_coefficients(phi_prime_deg: float) -> Tuple[float, float, float]:
+    def calculate_C_coefficients(phi_prime_deg: Union[float, np.ndarray]) -> Tuple:
         """
         Calculate C1, C2, C3 coefficients per API Figure 4 and Equations 26-27.
         
         IMPROVEMENT: Proper implementation of API formulas
+        (a scalar phi' is memoized, an array is computed element-wise)
         """
+        if np.ndim(phi_prime_deg) == 0:
+            return LateralCapacity._c_coefficients_scalar(float(phi_prime_deg))
+        return LateralCapacity._c_coefficients(phi_prime_deg)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _c_coefficients_scalar(phi_prime_deg: float) -> Tuple[float, float, float]:
+        """C1, C2, C3 for one phi' (constant-phi' layers reuse one result)."""
+        return LateralCapacity._c_coefficients(phi_prime_deg)
+
+    @staticmethod
+    def _c_coefficients(phi_prime_deg: Union[float, np.ndarray]) -> Tuple:
+        """C1, C2, C3 from the API formulas (uncached)."""
         phi_rad = np.deg2rad(phi_prime_deg)
         
         # K0 and Kp
@@ -1052,16 +1540,10 @@ class LateralCapacity:
             pu_D = 9 * su * D
 
         # p-y curve
-        if analysis_type == AnalysisType.STATIC:
-            p_ratios = np.array([0.0, 0.23, 0.33, 0.50, 0.72, 1.00, 1.00])
-            y_ratios = np.array([0.0, 0.1, 0.3, 1.0, 3.0, 8.0, np.inf])
+        if analysis_type != AnalysisType.STATIC and depth_m <= z_R:
+            p_ratios, y_ratios = MATLOCK_CYCLIC_SHALLOW_P_RATIOS, MATLOCK_CYCLIC_SHALLOW_Y_RATIOS
         else:
-            if depth_m <= z_R:
-                p_ratios = np.array([0.0, 0.23, 0.33, 0.50, 0.72, 0.72])
-                y_ratios = np.array([0.0, 0.1, 0.3, 1.0, 3.0, np.inf])
-            else:
-                p_ratios = np.array([0.0, 0.23, 0.33, 0.50, 0.72, 1.00, 1.00])
-                y_ratios = np.array([0.0, 0.1, 0.3, 1.0, 3.0, 8.0, np.inf])
+            p_ratios, y_ratios = MATLOCK_P_RATIOS, MATLOCK_Y_RATIOS
 
         # Get epsilon_50 from layer if available, otherwise use default
         epsilon_50_pct = profile.get_property_at_depth(depth_m, "epsilon_50")
@@ -1101,16 +1583,12 @@ class LateralCapacity:
 
         y_50 = epsilon_50 * D
 
+        # p_ratios represent fraction of ultimate resistance, y_ratios are
+        # normalized to y_50
         if analysis_type == AnalysisType.STATIC:
-            # y values normalized to y_50 (displacement at 50% resistance)
-            # p_ratios represent fraction of ultimate resistance
-            p_ratios = np.array([0.0, 0.25, 0.50, 0.75, 0.95, 0.95])
-            # y_ratios normalized to y_50: [0, 0.6, 2.0, 6.0, 20.0, inf]
-            # Multiply by y_50/0.5 to get actual y values
-            y_ratios = np.array([0.0, 0.3, 1.0, 3.0, 10.0, np.inf])
+            p_ratios, y_ratios = REESE_P_RATIOS, REESE_Y_RATIOS
         else:
-            p_ratios = np.array([0.0, 0.25, 0.50, 0.50])
-            y_ratios = np.array([0.0, 0.3, 1.0, np.inf])
+            p_ratios, y_ratios = REESE_CYCLIC_P_RATIOS, REESE_CYCLIC_Y_RATIOS
 
         p_resist = p_ratios * pu_D
         y_disp = y_ratios * y_50
@@ -1127,69 +1605,83 @@ class LateralCapacity:
 
         IMPROVEMENT: Uses site-specific k value if available, otherwise falls back to API Table 5
         """
-        layer = profile.get_layer_at_depth(depth_m)
-        phi_prime = profile.get_property_at_depth(depth_m, "phi_prime")
-        gamma_prime = profile.get_property_at_depth(depth_m, "gamma_prime")
+        y_disp, p_resist, valid = LateralCapacity.sand_py_curves([depth_m], profile, pile, analysis_type)
+        if not valid[0]:
+            return np.array([]), np.array([])
+        return y_disp, p_resist[0]
+
+    @staticmethod
+    def sand_py_curves(depths_m: Union[np.ndarray, List[float]], profile: SoilProfile,
+                       pile: PileProperties,
+                       analysis_type: AnalysisType = AnalysisType.STATIC
+                       ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        sand_py_curve at several depths in one pass.
+
+        Returns the shared displacements y (m), one row of p (kN/m) per depth
+        and a mask of the depths that have a curve.
+        """
+        z = np.asarray(depths_m, dtype=float)
+        # Per-layer attributes at each depth (the extra last entry is picked by
+        # index -1, i.e. depths outside all layers)
+        layer_idx = profile._layer_indices(z)
+        is_sand_layer = profile._soil_type_masks()[1][layer_idx]
+        dr_pct = np.array([layer.relative_density_pct for layer in profile.layers] + [np.nan])[layer_idx]
+        phi_prime = profile.get_property_profile(z, "phi_prime")
+        gamma_prime = profile.get_property_profile(z, "gamma_prime")
 
         # If phi_prime not available, estimate from relative density as fallback
-        if not np.isfinite(phi_prime) or phi_prime <= 0:
-            if layer and layer.soil_type in [SoilType.SAND, SoilType.SAND_SILT]:
-                # Fallback: Estimate phi from Dr (Bolton 1986 correlation)
-                Dr = layer.relative_density_pct
-                phi_prime = 28.0 + 0.17 * Dr
-            else:
-                return np.array([]), np.array([])
+        # (Bolton 1986 correlation) - sand layers only
+        no_phi = ~(np.isfinite(phi_prime) & (phi_prime > 0))
+        phi_prime = np.where(no_phi, 28.0 + 0.17 * dr_pct, phi_prime)
 
-        # If gamma_prime not available, use typical value for submerged soil
-        if not np.isfinite(gamma_prime) or gamma_prime <= 0:
-            if layer and layer.soil_type in [SoilType.SAND, SoilType.SAND_SILT]:
-                # Typical submerged unit weight for sand
-                gamma_prime = 10.0  # kN/m³ (conservative for submerged sand)
-            else:
-                return np.array([]), np.array([])
+        # If gamma_prime not available, use typical value for submerged sand
+        no_gamma = ~(np.isfinite(gamma_prime) & (gamma_prime > 0))
+        gamma_prime = np.where(no_gamma, 10.0, gamma_prime)  # kN/m³ (conservative)
+
+        valid = ~((no_phi | no_gamma) & ~is_sand_layer)
 
         D = pile.diameter_m
-        z = depth_m
 
         # Calculate C coefficients properly
-        C1, C2, C3 = LateralCapacity.calculate_C_coefficients(phi_prime)
+        C1, C2, C3 = (np.array(c) for c in zip(*map(LateralCapacity._c_coefficients_scalar,
+                                                    phi_prime.tolist())))
 
         # Ultimate pressures
         pu_shallow = (C1 * z + C2 * D) * gamma_prime * z
         pu_deep = C3 * D * gamma_prime * z
 
-        pu = min(pu_shallow, pu_deep)
+        pu = np.minimum(pu_shallow, pu_deep)
 
         # Get k value (subgrade reaction modulus)
         # Priority: 1) Site-specific value from testing, 2) API Table 5 interpolation
-        k = profile.get_property_at_depth(depth_m, "k")
-
-        if not np.isfinite(k) or k <= 0:
-            # Fallback to API RP 2GEO Table 5 - k values (MN/m³)
-            k_values_table5 = {25: 5.4, 30: 11, 35: 22, 40: 45}  # MN/m³
-            k_MNm3 = np.interp(phi_prime, list(k_values_table5.keys()), list(k_values_table5.values()))
-            k = k_MNm3 * 1000  # Convert MN/m³ to kN/m³
-
-        # k is now in kN/m³ (same units as input parameter)
+        k = profile.get_property_profile(z, "k")
+        no_k = ~(np.isfinite(k) & (k > 0))
+        # Fallback to API RP 2GEO Table 5 - k values (MN/m³), converted to kN/m³
+        k = np.where(no_k, np.interp(phi_prime, TABLE5_PHI_DEG, TABLE5_K_MNM3) * 1000, k)
 
         # Cyclic reduction
         if analysis_type == AnalysisType.CYCLIC:
-            A = 0.9
+            A = np.full(z.shape, 0.9)
         else:
-            A = 3.0 - 0.8 * z / D
-            A = max(A, 0.9)
+            A = np.maximum(3.0 - 0.8 * z / D, 0.9)
 
         # Generate curve with proper displacement range
         # Use maximum displacement of 0.2*D (API recommendation for sand)
         y_max = 0.2 * D  # meters (e.g., 200mm for 1m diameter pile)
         y_disp = np.linspace(0, y_max, 50)  # More points for smoother curve
-        p_resist = A * pu * np.tanh(k * z * y_disp / (A * pu + 0.01))
+        A_pu = (A * pu)[:, None]
+        p_resist = A_pu * np.tanh((k * z)[:, None] * y_disp / (A * pu + 0.01)[:, None])
 
-        return y_disp, p_resist
+        return y_disp, p_resist, valid
+
+    # Recent p-y tables by input signature, oldest first
+    _py_table_cache: Dict[tuple, pd.DataFrame] = {}
+    _PY_TABLE_CACHE_SIZE = 32
 
     @staticmethod
     def generate_py_table(profile: SoilProfile, pile: PileProperties,
-                         depths_m: List[float],
+                         depths_m: Union[np.ndarray, List[float]],
                          analysis_type: AnalysisType = AnalysisType.STATIC) -> pd.DataFrame:
         """
         Generate industry-standard p-y table in WIDE FORMAT.
@@ -1197,27 +1689,55 @@ class LateralCapacity:
         Format: One row per depth with 5 points
         Columns: Depth(m), Soil, p1, y1, p2, y2, p3, y3, p4, y4, p5, y5
         Units: p in kN/m, y in mm
+
+        Repeated calls with the same inputs (e.g. parameter sweeps) return a
+        copy of the cached table.
         """
+        depths = np.asarray(depths_m)
+        key = (profile._value_signature(), pile.diameter_m, analysis_type,
+               depths.dtype.str, tuple(depths.tolist()))
+        return _cached_table(
+            LateralCapacity._py_table_cache, LateralCapacity._PY_TABLE_CACHE_SIZE, key,
+            lambda: LateralCapacity._build_py_table(profile, pile, depths_m, analysis_type))
+
+    @staticmethod
+    def _build_py_table(profile: SoilProfile, pile: PileProperties,
+                        depths_m: Union[np.ndarray, List[float]],
+                        analysis_type: AnalysisType) -> pd.DataFrame:
+        """p-y table for generate_py_table (uncached)."""
         all_results = []
 
-        for depth in depths_m:
-            layer = profile.get_layer_at_depth(depth)
-            if layer is None:
+        # Clay curves per depth; sand curves for all sand depths in one batch
+        curves = {}
+        sand_depths = []
+        layer_idx = profile._layer_indices(depths_m)
+        # su at every depth in one pass picks Matlock (soft) or Reese (stiff) clay
+        su_at_depths = profile.get_property_profile(depths_m, "su").tolist()
+        for order, (depth, i, su) in enumerate(zip(depths_m, layer_idx, su_at_depths)):
+            if i < 0:
                 continue
+            layer = profile.layers[i]
 
             # Get p-y curve
-            if layer.soil_type in [SoilType.CLAY, SoilType.SILT]:
-                # Use profile method for consistency and to avoid attribute access issues
-                su = profile.get_property_at_depth(depth, "su")
+            if layer.soil_type in CLAY_SOIL_TYPES:
                 if np.isfinite(su) and su <= 100:
-                    y, p = LateralCapacity.matlock_soft_clay(depth, profile, pile, analysis_type)
+                    curves[order] = (
+                        depth, layer, LateralCapacity.matlock_soft_clay(depth, profile, pile, analysis_type))
                 elif np.isfinite(su) and su > 100:
-                    y, p = LateralCapacity.reese_stiff_clay(depth, profile, pile, analysis_type)
-                else:
-                    continue  # Skip if su is not available
+                    curves[order] = (
+                        depth, layer, LateralCapacity.reese_stiff_clay(depth, profile, pile, analysis_type))
             else:
-                y, p = LateralCapacity.sand_py_curve(depth, profile, pile, analysis_type)
+                sand_depths.append((order, depth, layer))
 
+        if sand_depths:
+            y_sand, p_sand, valid = LateralCapacity.sand_py_curves(
+                [depth for _, depth, _ in sand_depths], profile, pile, analysis_type)
+            for (order, depth, layer), p_row, has_curve in zip(sand_depths, p_sand, valid):
+                if has_curve:
+                    curves[order] = (depth, layer, (y_sand, p_row))
+
+        for order in sorted(curves):
+            depth, layer, (y, p) = curves[order]
             if len(y) == 0:
                 continue
 
@@ -1229,16 +1749,15 @@ class LateralCapacity:
             all_results.append(row)
 
         if not all_results:
-            cols = ['Depth', 'Soil'] + [f'{x}{i+1}' for x in ['p', 'y'] for i in range(5)]
-            return pd.DataFrame(columns=cols)
-
-        df = pd.DataFrame(all_results)
-        # Reorder columns: Depth, Soil, p1, y1, p2, y2, ..., p5, y5
-        col_order = ['Depth', 'Soil']
-        for i in range(1, 6):
-            col_order.extend([f'p{i}', f'y{i}'])
+            return _EMPTY_PY_TABLE.copy()
 
-        return df[col_order]
+        # Columns in order: Depth, Soil, p1, y1, p2, y2, ..., p5, y5
+        n = len(all_results)
+        return pd.DataFrame({
+            col: ([row[col] for row in all_results] if col == 'Soil'
+                  else np.fromiter((row[col] for row in all_results), dtype=float, count=n))
+            for col in PY_TABLE_COLUMNS
+        })
 
 
 # ============================================================================
@@ -1258,16 +1777,17 @@ class LoadDisplacementTables:
             return np.array([]), np.array([])
 
         z_peak = 0.01 * pile.diameter_m
-        t_residual = 0.8 * t_max
+        t_residual = TZ_CLAY_RESIDUAL_RATIO * t_max
 
-        z_ratios = np.array([0.0, 0.16, 0.31, 0.57, 0.80, 1.00, 2.00, np.inf])
-        t_ratios = np.array([0.0, 0.30, 0.50, 0.75, 0.90, 1.00, t_residual/t_max, t_residual/t_max])
+        t_ratios = np.empty(8)
+        t_ratios[:6] = TZ_CLAY_PEAK_T_RATIOS
+        t_ratios[6:] = t_residual/t_max
 
-        z_disp = z_ratios * z_peak
+        z_disp = TZ_CLAY_Z_RATIOS * z_peak
         t_resist = t_ratios * t_max
         # Remove artificial cap - let API curve ratios control displacement
         # z_disp can extend beyond z_peak per API recommendations
-        z_disp = np.where(np.isinf(z_disp), 10.0 * z_peak, z_disp)  # Replace inf with practical limit
+        z_disp[-1] = 10.0 * z_peak  # Replace the inf (last) ratio with practical limit
 
         return z_disp, t_resist
 
@@ -1282,13 +1802,10 @@ class LoadDisplacementTables:
 
         z_peak = 0.01 * pile.diameter_m
 
-        z_ratios = np.array([0.0, 0.16, 0.31, 0.57, 0.80, 1.00, np.inf])
-        t_ratios = np.array([0.0, 0.30, 0.50, 0.75, 0.90, 1.00, 1.00])
-
-        z_disp = z_ratios * z_peak
-        t_resist = t_ratios * t_max
+        z_disp = TZ_SAND_Z_RATIOS * z_peak
+        t_resist = TZ_SAND_T_RATIOS * t_max
         # Remove artificial cap - let API curve ratios control displacement
-        z_disp = np.where(np.isinf(z_disp), 10.0 * z_peak, z_disp)  # Replace inf with practical limit
+        z_disp[-1] = 10.0 * z_peak  # Replace the inf (last) ratio with practical limit
 
         return z_disp, t_resist
 
@@ -1301,7 +1818,7 @@ class LoadDisplacementTables:
         if layer is None:
             return np.array([]), np.array([])
 
-        if layer.soil_type in [SoilType.CLAY, SoilType.SILT]:
+        if layer.soil_type in CLAY_SOIL_TYPES:
             q = AxialCapacity.end_bearing_clay(depth_m, profile, pile)
         else:
             q = AxialCapacity.end_bearing_sand(depth_m, profile, pile)
@@ -1311,70 +1828,170 @@ class LoadDisplacementTables:
         if Q_p <= 0:
             return np.array([]), np.array([])
 
-        z_D_ratios = np.array([0.0, 0.002, 0.013, 0.042, 0.073, 0.100, np.inf])
-        Q_ratios = np.array([0.0, 0.25, 0.50, 0.75, 0.90, 1.00, 1.00])
-
-        z_disp = z_D_ratios * pile.diameter_m
-        Q_resist = Q_ratios * Q_p
+        z_disp = QZ_Z_D_RATIOS * pile.diameter_m
+        Q_resist = QZ_Q_RATIOS * Q_p
 
         return z_disp, Q_resist
 
+    @staticmethod
+    def tz_table_points(t_max: np.ndarray, pile: PileProperties,
+                        clay: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        discretize_tz_curve_8points of the clay (or sand) t-z curve for each
+        peak unit friction in t_max (kPa, all > 0), in one pass.
+
+        Returns t (MN/m) and z (mm), one row of 8 points per t_max.
+        """
+        t_max = np.asarray(t_max, dtype=float)[:, None]
+        z_peak = 0.01 * pile.diameter_m
+
+        # Same curves as tz_curve_clay / tz_curve_sand, one row per t_max
+        if clay:
+            z_ratios = TZ_CLAY_Z_RATIOS
+            residual = TZ_CLAY_RESIDUAL_RATIO * t_max / t_max
+            t_ratios = np.hstack([np.broadcast_to(TZ_CLAY_PEAK_T_RATIOS, (len(t_max), 6)),
+                                  residual, residual])
+        else:
+            z_ratios = TZ_SAND_Z_RATIOS
+            t_ratios = TZ_SAND_T_RATIOS[None, :]
+        z_disp = z_ratios * z_peak
+        z_disp[-1] = 10.0 * z_peak
+        t_resist = t_ratios * t_max
+
+        # Drop the leading (0, 0) point and sort the non-monotonic (clay) rows by t
+        z_disp, t_resist = z_disp[1:], t_resist[:, 1:]
+        order = np.argsort(t_resist, axis=1)
+        order[(np.diff(t_resist, axis=1) >= 0).all(axis=1)] = np.arange(t_resist.shape[1])
+        t_sorted = np.take_along_axis(t_resist, order, axis=1)
+
+        target_t = RATIOS_8_POINTS * t_resist.max(axis=1)[:, None]
+        z_interp = _interp_rows(target_t, t_sorted, z_disp[order])
+
+        # Convert units: t from kPa to MN/m, z from m to mm
+        return target_t / 1000.0, z_interp * 1000.0
+
+    @staticmethod
+    def _tz_points(profile: SoilProfile, pile: PileProperties, depths: np.ndarray,
+                   senses: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        t-z table points at each depth for each sense ('c' or 't'), sharing
+        one layer lookup and soil property pass across the senses.
+
+        Returns t and z of shape (depths, senses, 8) and a (depths, senses)
+        mask of the curves that exist (depths outside the profile or with no
+        friction have none).
+        """
+        _, kernel_inputs = AxialCapacity._shaft_friction_inputs(depths, profile)
+        is_clay = kernel_inputs[0]
+
+        n = len(depths)
+        t_points = np.zeros((n, len(senses), 8))
+        z_points = np.zeros((n, len(senses), 8))
+        has_curve = np.zeros((n, len(senses)), dtype=bool)
+        for k, s in enumerate(senses):
+            t_max = _unit_shaft_friction_kernel(*kernel_inputs, s == 't')
+            has_curve[:, k] = t_max > 0
+            for clay in (True, False):
+                rows = has_curve[:, k] & (is_clay == clay)
+                t_points[rows, k], z_points[rows, k] = LoadDisplacementTables.tz_table_points(
+                    t_max[rows], pile, clay)
+
+        return t_points, z_points, has_curve
+
+    @staticmethod
+    def _tz_frame(depths_m: Union[np.ndarray, List[float]], senses: Tuple[str, ...],
+                  t_points: np.ndarray, z_points: np.ndarray,
+                  has_curve: np.ndarray) -> pd.DataFrame:
+        """Wide t-z table from _tz_points output, senses in order at each depth."""
+        if not has_curve.any():
+            return _EMPTY_TZ_TABLE.copy()
+
+        keep = has_curve.ravel()
+        t_points = t_points.reshape(-1, 8)[keep]
+        z_points = z_points.reshape(-1, 8)[keep]
+        columns = {
+            'Depth': np.repeat(np.asarray(depths_m), len(senses))[keep],
+            'Soil type': np.tile(np.array(senses, dtype=object), len(has_curve))[keep],
+        }
+        for i in range(8):
+            columns[f't{i+1}'] = t_points[:, i]
+            columns[f'z{i+1}'] = z_points[:, i]
+
+        return pd.DataFrame(columns)
+
     @staticmethod
     def generate_tz_table(profile: SoilProfile, pile: PileProperties,
-                         depths_m: List[float]) -> pd.DataFrame:
+                         depths_m: Union[np.ndarray, List[float]], sense: Optional[str] = None) -> pd.DataFrame:
         """
         Generate industry-standard t-z table in WIDE FORMAT.
 
-        Format: Each depth has TWO rows (compression 'c' and tension 't')
+        Format: Each depth has TWO rows (compression 'c' and tension 't'), or
+        only the rows of one sense if sense is 'c' or 't'
         Columns: Depth(m), Soil type, t1, z1, t2, z2, t3, z3, t4, z4, t5, z5
         Units: t in MN/m, z in mm
         """
-        all_results = []
+        senses = ('c', 't') if sense is None else (sense,)
+        if any(s not in ('c', 't') for s in senses):
+            raise ValueError(f"sense must be 'c', 't' or None, not {sense!r}")
 
-        for depth in depths_m:
-            layer = profile.get_layer_at_depth(depth)
-            if layer is None:
-                continue
+        depths = np.asarray(depths_m, dtype=float)
+        return LoadDisplacementTables._tz_frame(
+            depths_m, senses, *LoadDisplacementTables._tz_points(profile, pile, depths, senses))
 
-            # Generate COMPRESSION row
-            if layer.soil_type in [SoilType.CLAY, SoilType.SILT]:
-                z_disp_c, t_resist_c = LoadDisplacementTables.tz_curve_clay(depth, profile, pile, for_tension=False)
-            else:
-                z_disp_c, t_resist_c = LoadDisplacementTables.tz_curve_sand(depth, profile, pile, for_tension=False)
+    @staticmethod
+    def generate_tz_tables(profile: SoilProfile, pile: PileProperties,
+                           depths_m: Union[np.ndarray, List[float]]
+                           ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        generate_tz_table for compression and tension as separate tables,
+        sharing the layer lookup and soil property pass.
 
-            if len(z_disp_c) > 0:
-                row_c = discretize_tz_curve_8points(z_disp_c, t_resist_c)
-                row_c['Depth'] = depth
-                row_c['Soil type'] = 'c'
-                all_results.append(row_c)
+        Returns the (compression, tension) tables.
+        """
+        depths = np.asarray(depths_m, dtype=float)
+        t_points, z_points, has_curve = LoadDisplacementTables._tz_points(
+            profile, pile, depths, ('c', 't'))
+        return tuple(
+            LoadDisplacementTables._tz_frame(depths_m, (s,), t_points[:, k:k + 1],
+                                             z_points[:, k:k + 1], has_curve[:, k:k + 1])
+            for k, s in enumerate(('c', 't')))
 
-            # Generate TENSION row
-            if layer.soil_type in [SoilType.CLAY, SoilType.SILT]:
-                z_disp_t, t_resist_t = LoadDisplacementTables.tz_curve_clay(depth, profile, pile, for_tension=True)
-            else:
-                z_disp_t, t_resist_t = LoadDisplacementTables.tz_curve_sand(depth, profile, pile, for_tension=True)
+    @staticmethod
+    def qz_table_points(Q_p: np.ndarray, pile: PileProperties) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        discretize_qz_curve_8points of the Q-z curve for each tip capacity in
+        Q_p (kN, all > 0), in one pass.
 
-            if len(z_disp_t) > 0:
-                row_t = discretize_tz_curve_8points(z_disp_t, t_resist_t)
-                row_t['Depth'] = depth
-                row_t['Soil type'] = 't'
-                all_results.append(row_t)
+        Returns Q (MN) and z (mm), one row of 8 points per Q_p.
+        """
+        Q_p = np.asarray(Q_p, dtype=float)[:, None]
 
-        if not all_results:
-            cols = ['Depth', 'Soil type'] + [f'{x}{i+1}' for x in ['t', 'z'] for i in range(8)]
-            return pd.DataFrame(columns=cols)
+        # Same curve as qz_curve, one row per Q_p, without the leading (0, 0)
+        # point; Q rises with z, so no sorting is needed
+        z_disp = np.broadcast_to(QZ_Z_D_RATIOS[1:] * pile.diameter_m, (len(Q_p), 6))
+        Q_resist = QZ_Q_RATIOS[1:] * Q_p
+
+        target_Q = RATIOS_8_POINTS * Q_resist.max(axis=1)[:, None]
+        z_interp = _interp_rows(target_Q, Q_resist, z_disp)
+
+        # Convert units: Q from kN to MN, z from m to mm
+        return target_Q / 1000.0, z_interp * 1000.0
 
-        df = pd.DataFrame(all_results)
-        # Reorder columns: Depth, Soil type, t1, z1, t2, z2, ..., t8, z8
-        col_order = ['Depth', 'Soil type']
-        for i in range(1, 9):
-            col_order.extend([f't{i}', f'z{i}'])
+    # Q-z tables by input signature (see _qz_table_key), oldest insert first
+    _qz_table_cache: Dict[tuple, pd.DataFrame] = {}
+    _QZ_TABLE_CACHE_SIZE = 32
 
-        return df[col_order]
+    @staticmethod
+    def _qz_table_key(profile: SoilProfile, pile: PileProperties,
+                      depths_m: Union[np.ndarray, List[float]]) -> tuple:
+        """Everything a Q-z table depends on, by value (not identity)."""
+        depths = np.asarray(depths_m)
+        return (profile._value_signature(), pile.diameter_m, pile.area_gross_m2,
+                pile.pile_type, depths.dtype.str, tuple(depths.tolist()))
 
     @staticmethod
     def generate_qz_table(profile: SoilProfile, pile: PileProperties,
-                         depths_m: List[float]) -> pd.DataFrame:
+                         depths_m: Union[np.ndarray, List[float]]) -> pd.DataFrame:
         """
         Generate industry-standard Q-z table in WIDE FORMAT for multiple depths.
 
@@ -1382,45 +1999,46 @@ class LoadDisplacementTables:
         Columns: Depth(m), Soil type, tip, q1, z1, q2, z2, q3, z3, q4, z4, q5, z5
         Units: q in MN, z in mm
         tip: 0=unplugged, 1=plugged
-        """
-        all_results = []
-
-        for depth in depths_m:
-            # Ensure depth is valid
-            if depth <= 0:
-                continue
 
-            z_disp, Q_resist = LoadDisplacementTables.qz_curve(depth, profile, pile)
-
-            if len(z_disp) == 0:
-                continue  # Skip this depth if no data
-
-            # Discretize to 8 points
-            row = discretize_qz_curve_8points(z_disp, Q_resist)
-            row['Depth'] = depth
-
-            # Get soil type at this depth
-            layer = profile.get_layer_at_depth(depth)
-            row['Soil type'] = layer.soil_type.value if layer else 'SAND'
-
-            # Determine if plugged (plugged=1 for closed-end piles)
-            row['tip'] = 1 if pile.pile_type == PileType.DRIVEN_PIPE_CLOSED else 0
-
-            all_results.append(row)
-
-        if not all_results:
-            # Return empty DataFrame with proper columns
-            cols = ['Depth', 'Soil type', 'tip'] + [f'{x}{i+1}' for x in ['q', 'z'] for i in range(8)]
-            return pd.DataFrame(columns=cols)
-
-        df = pd.DataFrame(all_results)
+        Repeated calls with the same inputs (e.g. parameter sweeps) return a
+        copy of the cached table.
+        """
+        return _cached_table(
+            LoadDisplacementTables._qz_table_cache, LoadDisplacementTables._QZ_TABLE_CACHE_SIZE,
+            LoadDisplacementTables._qz_table_key(profile, pile, depths_m),
+            lambda: LoadDisplacementTables._build_qz_table(profile, pile, depths_m))
 
-        # Reorder columns
-        col_order = ['Depth', 'Soil type', 'tip']
-        for i in range(1, 9):
-            col_order.extend([f'q{i}', f'z{i}'])
+    @staticmethod
+    def _build_qz_table(profile: SoilProfile, pile: PileProperties,
+                        depths_m: Union[np.ndarray, List[float]]) -> pd.DataFrame:
+        """Q-z table for generate_qz_table (uncached)."""
+        depths = np.asarray(depths_m, dtype=float)
+        layer_idx = profile._layer_indices(depths)
+
+        # Tip capacity at each depth; depths with none (or not below the
+        # seafloor) get no row
+        Q_p = AxialCapacity.unit_end_bearing_profile(depths, profile, pile) * pile.area_gross_m2
+        has_curve = (depths > 0) & (Q_p > 0)
+
+        if not has_curve.any():
+            return _EMPTY_QZ_TABLE.copy()
+
+        q_points, z_points = LoadDisplacementTables.qz_table_points(Q_p[has_curve], pile)
+
+        # Determine if plugged (plugged=1 for closed-end piles)
+        tip = 1 if pile.pile_type == PileType.DRIVEN_PIPE_CLOSED else 0
+
+        columns = {
+            'Depth': np.asarray(depths_m)[has_curve],
+            'Soil type': np.array([layer.soil_type.value for layer in profile.layers],
+                                  dtype=object)[layer_idx[has_curve]],
+            'tip': np.full(int(has_curve.sum()), tip),
+        }
+        for i in range(8):
+            columns[f'q{i+1}'] = q_points[:, i]
+            columns[f'z{i+1}'] = z_points[:, i]
 
-        return df[col_order]
+        return pd.DataFrame(columns)
 
 
 # ============================================================================
@@ -1435,6 +2053,65 @@ class PileDesignAnalysis:
         self.pile = pile
         self.results = {}
 
+    @staticmethod
+    def default_table_depths(max_depth_m: float, depth_interval: float) -> np.ndarray:
+        """Default depths shared by the t-z, Q-z and p-y tables."""
+        default_depths = np.arange(depth_interval, max_depth_m + 0.1, depth_interval)
+        # Ensure we have at least one depth
+        if len(default_depths) == 0:
+            default_depths = np.array([min(depth_interval, max_depth_m)], dtype=float)
+        return default_depths
+
+    def default_qz_depths(self, default_depths: Union[np.ndarray, List[float]],
+                          max_depth_m: float) -> List[float]:
+        """Default Q-z depths: the table depths plus the pile tip."""
+        qz_depths = [float(d) for d in default_depths]
+
+        # Also include the pile tip depth if it's within range and different
+        pile_tip_depth = self.pile.length_m if self.pile.length_m > 0 else max_depth_m
+        if pile_tip_depth > 0 and pile_tip_depth <= max_depth_m:
+            # Add pile tip if not already in list (within tolerance)
+            if not any(abs(d - pile_tip_depth) < 0.5 for d in qz_depths):
+                qz_depths.append(pile_tip_depth)
+                qz_depths = sorted(qz_depths)
+        return qz_depths
+
+    def capacity_profiles(self, max_depth_m: float, dz: float = 0.5,
+                          use_lrfd: bool = True) -> Dict:
+        """Compression and tension capacity profiles."""
+        compression_df, tension_df = AxialCapacity.compute_capacity_profiles(
+            self.profile, self.pile, max_depth_m, dz,
+            resistance_factor=None if use_lrfd else 1.0
+        )
+        return {
+            'capacity_compression_df': compression_df,
+            'capacity_tension_df': tension_df,
+        }
+
+    def load_displacement_tables(self, tz_depths: Union[np.ndarray, List[float]],
+                                 qz_depths: Union[np.ndarray, List[float]]) -> Dict:
+        """t-z (compression and tension) and Q-z tables at the given depths."""
+        # Separate compression and tension tables, from one shared pass
+        tz_compression, tz_tension = LoadDisplacementTables.generate_tz_tables(
+            self.profile, self.pile, tz_depths
+        )
+        return {
+            'tz_compression_table': tz_compression,
+            'tz_tension_table': tz_tension,
+            'qz_table': LoadDisplacementTables.generate_qz_table(
+                self.profile, self.pile, qz_depths
+            ),
+        }
+
+    def lateral_tables(self, py_depths: Union[np.ndarray, List[float]],
+                       analysis_type: AnalysisType = AnalysisType.STATIC) -> Dict:
+        """p-y table at the given depths."""
+        return {
+            'py_table': LateralCapacity.generate_py_table(
+                self.profile, self.pile, py_depths, analysis_type
+            ),
+        }
+
     def run_complete_analysis(self, max_depth_m: float, dz: float = 0.5,
                              depth_interval: float = 1.0,
                              tz_depths: Optional[List[float]] = None,
@@ -1474,65 +2151,23 @@ class PileDesignAnalysis:
         - qz_table: Q-z table (8 points, multiple depths)
         - py_table: p-y table (8 points, multiple depths)
         """
-        results = {}
-
-        # Capacity profiles
-        results['capacity_compression_df'] = AxialCapacity.compute_capacity_profile(
-            self.profile, self.pile, max_depth_m, dz, LoadingType.COMPRESSION,
-            resistance_factor=None if use_lrfd else 1.0
-        )
-
-        results['capacity_tension_df'] = AxialCapacity.compute_capacity_profile(
-            self.profile, self.pile, max_depth_m, dz, LoadingType.TENSION,
-            resistance_factor=None if use_lrfd else 1.0
-        )
+        default_depths = self.default_table_depths(max_depth_m, depth_interval)
 
         # t-z tables with user-configurable depth intervals (SEPARATE tables now)
         if tz_depths is None:
-            tz_depths = np.arange(depth_interval, max_depth_m + 0.1, depth_interval).tolist()
-            # Ensure we have at least one depth
-            if not tz_depths:
-                tz_depths = [min(depth_interval, max_depth_m)]
-
-        tz_table_combined = LoadDisplacementTables.generate_tz_table(
-            self.profile, self.pile, tz_depths
-        )
-
-        # Split into separate compression and tension tables
-        results['tz_compression_table'] = tz_table_combined[tz_table_combined['Soil type'] == 'c'].copy()
-        results['tz_tension_table'] = tz_table_combined[tz_table_combined['Soil type'] == 't'].copy()
+            tz_depths = default_depths
 
         # Q-z table (user-configurable depth intervals)
         if qz_depths is None:
-            qz_depths = np.arange(depth_interval, max_depth_m + 0.1, depth_interval).tolist()
-
-            # Ensure we have at least one depth
-            if not qz_depths:
-                qz_depths = [min(depth_interval, max_depth_m)]
-
-            # Also include the pile tip depth if it's within range and different
-            pile_tip_depth = self.pile.length_m if self.pile.length_m > 0 else max_depth_m
-            if pile_tip_depth > 0 and pile_tip_depth <= max_depth_m:
-                # Add pile tip if not already in list (within tolerance)
-                if not any(abs(d - pile_tip_depth) < 0.5 for d in qz_depths):
-                    qz_depths.append(pile_tip_depth)
-                    qz_depths = sorted(qz_depths)
-
-        results['qz_table'] = LoadDisplacementTables.generate_qz_table(
-            self.profile, self.pile, qz_depths
-        )
+            qz_depths = self.default_qz_depths(default_depths, max_depth_m)
 
         # p-y table (user-configurable depth intervals)
         if py_depths is None:
-            py_depths = np.arange(depth_interval, max_depth_m + 0.1, depth_interval).tolist()
-            # Ensure we have at least one depth
-            if not py_depths:
-                py_depths = [min(depth_interval, max_depth_m)]
-
-        results['py_table'] = LateralCapacity.generate_py_table(
-            self.profile, self.pile, py_depths, analysis_type
-        )
+            py_depths = default_depths
 
+        results = self.capacity_profiles(max_depth_m, dz, use_lrfd)
+        results.update(self.load_displacement_tables(tz_depths, qz_depths))
+        results.update(self.lateral_tables(py_depths, analysis_type))
         return results
 
 
@@ -1566,7 +2201,7 @@ def generate_design_soil_parameters_table(profile: SoilProfile) -> pd.DataFrame:
             'Submerged Unit Weight (kN/m³)': f"{gamma_prime:.2f}" if np.isfinite(gamma_prime) else "-",
         }
 
-        if layer.soil_type in [SoilType.SAND, SoilType.SAND_SILT]:
+        if layer.soil_type in SAND_SOIL_TYPES:
             # Sand parameters
             phi_prime = profile.get_property_at_depth(mid_depth, "phi_prime")
 
@@ -1583,8 +2218,7 @@ def generate_design_soil_parameters_table(profile: SoilProfile) -> pd.DataFrame:
                 Nq = from_table.get('Nq', np.nan)
 
                 # k from API Table 5
-                k_values_table5 = {25: 5.4, 30: 11, 35: 22, 40: 45}  # MN/m³
-                k_MNm3 = np.interp(phi_prime, list(k_values_table5.keys()), list(k_values_table5.values()))
+                k_MNm3 = np.interp(phi_prime, TABLE5_PHI_DEG, TABLE5_K_MNM3)
                 k_kNm3 = k_MNm3 * 1000  # Convert to kN/m³
 
                 row.update({
@@ -1878,8 +2512,8 @@ def generate_pdf_report(
     # Capacity summary
     df_comp = results.get('capacity_compression_df', pd.DataFrame())
     if not df_comp.empty:
-        max_cap_comp = df_comp['total_capacity_kN'].max()
-        depth_max_comp = df_comp.loc[df_comp['total_capacity_kN'].idxmax(), 'depth_m']
+        # Peak only (its depth is not reported here); NaN-skipping like Series.max
+        max_cap_comp = np.nanmax(df_comp['total_capacity_kN'].to_numpy())
 
         capacity_summary = [
             ['', 'Compression', 'Tension'],
@@ -1889,7 +2523,7 @@ def generate_pdf_report(
         if 'Tension' in config.get('analysis_types', []):
             df_tens = results.get('capacity_tension_df', pd.DataFrame())
             if not df_tens.empty:
-                max_cap_tens = df_tens['total_capacity_kN'].max()
+                max_cap_tens = np.nanmax(df_tens['total_capacity_kN'].to_numpy())
                 capacity_summary[1][2] = f"{max_cap_tens:,.0f}"
 
         cap_table = Table(capacity_summary, colWidths=[70*mm, 45*mm, 45*mm])
@@ -2089,4 +2723,5 @@ __all__ = [
     'generate_pdf_report',
     'REPORTLAB_AVAILABLE',
     'KALEIDO_AVAILABLE',
+    'NUMBA_AVAILABLE',
 ]
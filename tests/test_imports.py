@@ -1,6 +1,8 @@
 """
 Basic tests to validate module imports.
 """
+import numpy as np
+import pandas as pd
 import pytest
 
 
@@ -71,3 +73,225 @@ def test_basic_calculations():
 
     assert pile.diameter_m == 1.5
     assert pile.length_m == 15.0
+
+
+def test_sand_py_subgrade_modulus_follows_phi():
+    """Test that the sand p-y curve uses the Table 5 subgrade modulus for phi'."""
+    import numpy as np
+    from calculations_v2_1 import (
+        SoilType, SoilLayer, PileProperties, SoilProfile, SoilPoint, LateralCapacity,
+        TABLE5_PHI_DEG, TABLE5_K_MNM3
+    )
+
+    pile = PileProperties(diameter_m=1.5, wall_thickness_m=0.05, length_m=15.0)
+    z = 5.0
+    for phi in (25.0, 32.5, 40.0):
+        layer = SoilLayer(
+            name="Test Sand",
+            soil_type=SoilType.SAND,
+            depth_top_m=0.0,
+            depth_bot_m=20.0,
+            gamma_prime_kNm3=[SoilPoint(0.0, 8.0)],
+            phi_prime_deg=[SoilPoint(0.0, phi)]
+        )
+        profile = SoilProfile(site_name="Test Site", layers=[layer])
+        y, p = LateralCapacity.sand_py_curve(z, profile, pile)
+
+        # p = A*pu * tanh(k*z*y / (A*pu + 0.01)); y[2] == 2*y[1] and
+        # tanh(2x) = 2t / (1 + t^2) recover t = tanh(x), A*pu and then k
+        assert y[2] == 2 * y[1]
+        t = np.sqrt(2 * p[1] / p[2] - 1)
+        A_pu = p[1] / t
+        k = np.arctanh(t) / y[1] * (A_pu + 0.01) / z
+
+        expected_k = np.interp(phi, TABLE5_PHI_DEG, TABLE5_K_MNM3) * 1000
+        assert k == pytest.approx(expected_k, rel=1e-6)
+
+
+def _mixed_profile():
+    """Clay over sand over stiffer clay, for checking the grid methods."""
+    from calculations_v2_1 import SoilType, SoilLayer, SoilProfile, SoilPoint
+
+    layers = [
+        SoilLayer(
+            name="Soft Clay",
+            soil_type=SoilType.CLAY,
+            depth_top_m=0.0,
+            depth_bot_m=6.0,
+            gamma_prime_kNm3=[SoilPoint(0.0, 6.0), SoilPoint(6.0, 7.0)],
+            su_kPa=[SoilPoint(0.0, 5.0), SoilPoint(6.0, 30.0)]
+        ),
+        SoilLayer(
+            name="Dense Sand",
+            soil_type=SoilType.SAND,
+            depth_top_m=6.0,
+            depth_bot_m=12.0,
+            gamma_prime_kNm3=[SoilPoint(6.0, 9.0)],
+            phi_prime_deg=[SoilPoint(6.0, 34.0)],
+            relative_density_pct=75.0
+        ),
+        SoilLayer(
+            name="Stiff Clay",
+            soil_type=SoilType.CLAY,
+            depth_top_m=12.0,
+            depth_bot_m=20.0,
+            gamma_prime_kNm3=[SoilPoint(12.0, 8.0)],
+            su_kPa=[SoilPoint(12.0, 80.0), SoilPoint(20.0, 150.0)]
+        ),
+    ]
+    return SoilProfile(site_name="Test Site", layers=layers)
+
+
+def _check_capacity_profiles_match_layered():
+    from calculations_v2_1 import PileProperties, AxialCapacity, LoadingType
+
+    profile = _mixed_profile()
+    pile = PileProperties(diameter_m=1.5, wall_thickness_m=0.05, length_m=20.0)
+    df_comp, df_tens = AxialCapacity.compute_capacity_profiles(profile, pile, 19.0)
+
+    for df, loading_type in ((df_comp, LoadingType.COMPRESSION),
+                             (df_tens, LoadingType.TENSION)):
+        for tip in (2.5, 6.0, 9.5, 12.5, 19.0):
+            row = df[np.isclose(df['depth_m'], tip)].iloc[0]
+            expected = AxialCapacity.total_capacity_layered(profile, pile, tip, loading_type)
+            assert row['total_capacity_kN'] == pytest.approx(expected['total_capacity_kN'])
+            assert row['cumulative_friction_kN'] == pytest.approx(expected['shaft_friction_kN'])
+            assert row['penetration_status'] == expected['penetration_status']
+
+
+def test_capacity_profiles_match_total_capacity_layered():
+    """Test that the capacity profiles equal total_capacity_layered at each tip depth."""
+    _check_capacity_profiles_match_layered()
+
+
+def test_capacity_profiles_match_without_numba(monkeypatch):
+    """Test the same with the kernels run as plain Python (no numba)."""
+    import calculations_v2_1
+
+    for name in ('_unit_shaft_friction_kernel', '_cumulative_friction_kernel'):
+        kernel = getattr(calculations_v2_1, name)
+        monkeypatch.setattr(calculations_v2_1, name, getattr(kernel, 'py_func', kernel))
+    _check_capacity_profiles_match_layered()
+
+
+def test_unit_shaft_friction_profile_matches_scalar_methods():
+    """Test that the gridded unit shaft friction equals the per-depth methods."""
+    from calculations_v2_1 import PileProperties, AxialCapacity, SoilType
+
+    profile = _mixed_profile()
+    pile = PileProperties(diameter_m=1.5, wall_thickness_m=0.05, length_m=20.0)
+    depths = np.arange(0.0, 22.0, 0.25)
+
+    for for_tension in (False, True):
+        f, layers = AxialCapacity.unit_shaft_friction_profile(depths, profile, pile, for_tension)
+        assert len(layers) == len(depths)
+        for depth, f_z, layer in zip(depths, f, layers):
+            if layer is None:
+                assert f_z == 0.0
+                continue
+            scalar = (AxialCapacity.sand_shaft_friction if layer.soil_type == SoilType.SAND
+                      else AxialCapacity.clay_shaft_friction)
+            assert f_z == pytest.approx(scalar(depth, profile, pile, for_tension))
+
+
+def _table_caches():
+    """(class, cache, size attribute, cached and uncached table functions) per table cache."""
+    from calculations_v2_1 import AnalysisType, LateralCapacity, LoadDisplacementTables
+
+    return {
+        'p-y': (LateralCapacity, '_py_table_cache', '_PY_TABLE_CACHE_SIZE',
+                LateralCapacity.generate_py_table,
+                lambda profile, pile, depths: LateralCapacity._build_py_table(
+                    profile, pile, depths, AnalysisType.STATIC)),
+        'Q-z': (LoadDisplacementTables, '_qz_table_cache', '_QZ_TABLE_CACHE_SIZE',
+                LoadDisplacementTables.generate_qz_table,
+                LoadDisplacementTables._build_qz_table),
+    }
+
+
+@pytest.fixture(params=['p-y', 'Q-z'])
+def table_cache(request, monkeypatch):
+    """An empty table cache and the functions that use it."""
+    cls, cache_name, size_name, generate, build = _table_caches()[request.param]
+    cache = {}
+    monkeypatch.setattr(cls, cache_name, cache)
+    return cache, getattr(cls, size_name), generate, build
+
+
+def test_table_cache_misses_on_changed_point(table_cache):
+    """Test that changing a soil point of the same profile gives a new table."""
+    from calculations_v2_1 import PileProperties, SoilPoint
+
+    cache, _, generate, build = table_cache
+    profile = _mixed_profile()
+    pile = PileProperties(diameter_m=1.5, wall_thickness_m=0.05, length_m=20.0)
+    depths = np.array([2.0, 5.0, 8.0, 11.0, 15.0])
+
+    before = generate(profile, pile, depths)
+    profile.layers[0].su_kPa[1] = SoilPoint(6.0, 45.0)
+    profile.layers[1].phi_prime_deg[0] = SoilPoint(6.0, 38.0)
+    profile.layers[2].su_kPa[0] = SoilPoint(12.0, 120.0)
+    after = generate(profile, pile, depths)
+
+    assert len(cache) == 2
+    assert not after.equals(before)
+    pd.testing.assert_frame_equal(after, build(profile, pile, depths))
+
+
+def test_table_cache_returns_copies(table_cache):
+    """Test that changing a returned table leaves the cached table as built."""
+    from calculations_v2_1 import PileProperties
+
+    _, _, generate, build = table_cache
+    profile = _mixed_profile()
+    pile = PileProperties(diameter_m=1.5, wall_thickness_m=0.05, length_m=20.0)
+    depths = np.array([2.0, 5.0, 8.0, 11.0, 15.0])
+
+    table = generate(profile, pile, depths)
+    table.iloc[:, 2:] = -1.0
+    table.drop(index=0, inplace=True)
+
+    pd.testing.assert_frame_equal(generate(profile, pile, depths), build(profile, pile, depths))
+
+
+def test_table_cache_evicts_oldest_insert(table_cache):
+    """Test that a full cache drops its oldest insert, even if it was just hit."""
+    from calculations_v2_1 import PileProperties
+
+    cache, max_entries, generate, _ = table_cache
+    profile = _mixed_profile()
+    pile = PileProperties(diameter_m=1.5, wall_thickness_m=0.05, length_m=20.0)
+    depth_sets = [np.array([1.0 + 0.5 * i]) for i in range(max_entries + 1)]
+
+    for depths in depth_sets[:max_entries]:
+        generate(profile, pile, depths)
+    keys = list(cache)
+    assert len(keys) == max_entries
+
+    generate(profile, pile, depth_sets[0])
+    assert list(cache) == keys
+
+    generate(profile, pile, depth_sets[-1])
+    assert len(cache) == max_entries
+    assert list(cache)[:-1] == keys[1:]
+
+
+def test_table_cache_ignores_unused_layer_fields(table_cache):
+    """Test that the layer fields left out of the cache key do not change the tables."""
+    from calculations_v2_1 import PileProperties
+
+    cache, _, generate, build = table_cache
+    pile = PileProperties(diameter_m=1.5, wall_thickness_m=0.05, length_m=20.0)
+    depths = np.array([2.0, 5.0, 8.0, 11.0, 15.0])
+
+    profile = _mixed_profile()
+    varied = _mixed_profile()
+    for layer in varied.layers:
+        layer.name = f"Renamed {layer.name}"
+        layer.is_cemented = True
+        layer.carbonate_content_pct = 80.0
+
+    pd.testing.assert_frame_equal(build(varied, pile, depths), build(profile, pile, depths))
+    generate(profile, pile, depths)
+    generate(varied, pile, depths)
+    assert len(cache) == 1